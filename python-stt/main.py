@@ -16,6 +16,7 @@ Related Requirements:
 import sys
 import os
 import asyncio
+import base64
 import logging
 import time
 from typing import Dict, Any
@@ -34,6 +35,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _decode_audio_data(audio_data) -> bytes:
+    """
+    Convert an IPC audio_data payload to raw 16-bit PCM bytes.
+
+    Accepts the u8 array sent by Rust (list of ints), a base64 string
+    (compact JSON form, ~4/3 bytes per sample byte instead of up to 4),
+    or bytes-like data.
+    """
+    if isinstance(audio_data, str):
+        return base64.b64decode(audio_data, validate=True)
+    return bytes(audio_data)
+
+
 class AudioProcessor:
     """
     Audio processing orchestrator for VAD → Pipeline → STT flow.
@@ -208,8 +222,8 @@ class AudioProcessor:
             })
             return
 
-        # Convert audio data (u8 array from Rust) to bytes
-        audio_bytes = bytes(audio_data)
+        # Convert audio data (u8 array or base64 string from Rust) to bytes
+        audio_bytes = _decode_audio_data(audio_data)
 
         # Split into 10ms frames (STT-REQ-003.2)
         frames = self.vad.split_into_frames(audio_bytes)
@@ -283,7 +297,6 @@ class AudioProcessor:
         Args:
             msg: IPC message with audio_data field
         """
-        import time
         t_start = time.perf_counter()
 
         msg_id = msg.get('id', 'unknown')
@@ -293,8 +306,8 @@ class AudioProcessor:
             logger.warning("Empty audio_data received for stream")
             return
 
-        # Convert audio data (u8 array from Rust) to bytes
-        audio_bytes = bytes(audio_data)
+        # Convert audio data (u8 array or base64 string from Rust) to bytes
+        audio_bytes = _decode_audio_data(audio_data)
         t_convert = time.perf_counter()
 
         # Split into 10ms frames (STT-REQ-003.2)
@@ -727,7 +740,6 @@ async def main():
             await asyncio.sleep(0.5)
 
             # Emit scripted model_change event
-            import time
             await processor.ipc.send_message({
                 'type': 'event',
                 'version': '1.0',
@@ -812,6 +824,10 @@ async def main():
                 logger.warning("Monitoring task did not stop within timeout")
                 monitoring_task.cancel()
 
+        # Stop the STT micro-batch worker and fail any queued transcriptions
+        if processor and processor.stt_engine:
+            await processor.stt_engine.close()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -14,9 +14,10 @@ Requirements:
 
 import asyncio
 import logging
-from typing import Optional, AsyncGenerator, Dict, Any, List
+from typing import Optional, AsyncGenerator, Dict, Any, Iterable, List, Mapping, TypedDict
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 import time
 
 logger = logging.getLogger(__name__)
@@ -69,6 +70,25 @@ class TranscriptionResult:
     processing_time_ms: int = 0
 
 
+class PipelineEvent(TypedDict, total=False):
+    """
+    Event emitted by AudioPipeline (a plain dict at runtime).
+
+    Keys present depend on `event`:
+        speech_start: timestamp
+        speech_end: segment
+        partial_text: transcription, latency_metrics
+        final_text: transcription, segment, latency_metrics
+        error: error, segment
+    """
+    event: str
+    timestamp: float
+    transcription: Dict[str, Any]
+    segment: Dict[str, Any]
+    latency_metrics: Dict[str, Any]
+    error: str
+
+
 class AudioPipeline:
     """
     Orchestrates audio processing pipeline.
@@ -129,7 +149,7 @@ class AudioPipeline:
             f"stt={'enabled' if stt_engine else 'disabled'}"
         )
 
-    async def process_audio_frame(self, audio_frame: bytes) -> Optional[Dict[str, Any]]:
+    async def process_audio_frame(self, audio_frame: bytes) -> Optional[PipelineEvent]:
         """
         Process a single audio frame through the pipeline.
 
@@ -156,6 +176,70 @@ class AudioPipeline:
             return None
 
         # Step 2: Handle VAD events
+        return await self._handle_vad_event(vad_result)
+
+    async def process_audio_frames(self, audio_frames: Iterable[bytes]) -> List[PipelineEvent]:
+        """
+        Process a batch of audio frames through the pipeline.
+
+        Equivalent to calling process_audio_frame() for each frame and
+        collecting the non-None results, but frames without a VAD event are
+        handled in a plain loop (no coroutine per frame); only speech
+        start/end events are awaited.
+
+        Args:
+            audio_frames: Raw audio frames (10ms, 16kHz, mono), in order
+
+        Returns:
+            List of event dicts, in the order they occurred
+        """
+        if not self.vad:
+            logger.warning("VAD not configured, cannot process audio")
+            return []
+
+        events = []
+        process_frame = self.vad.process_frame
+
+        for audio_frame in audio_frames:
+            vad_result = process_frame(audio_frame)
+            if not vad_result:
+                continue
+
+            event = await self._handle_vad_event(vad_result)
+            if event:
+                events.append(event)
+
+        return events
+
+    async def process_audio_buffer(self, audio_data: bytes) -> List[PipelineEvent]:
+        """
+        Process a contiguous PCM buffer holding several 10ms frames.
+
+        The buffer is split with the VAD's split_into_frames() (a trailing
+        partial frame is discarded) and fed to process_audio_frames().
+
+        Args:
+            audio_data: Raw audio data (16kHz, mono, 16-bit PCM)
+
+        Returns:
+            List of event dicts, in the order they occurred
+        """
+        if not self.vad:
+            logger.warning("VAD not configured, cannot process audio")
+            return []
+
+        return await self.process_audio_frames(self.vad.split_into_frames(audio_data))
+
+    async def _handle_vad_event(self, vad_result: Dict[str, Any]) -> Optional[PipelineEvent]:
+        """
+        Dispatch a VAD event to the speech start/end handlers.
+
+        Args:
+            vad_result: Non-empty result from VAD process_frame()
+
+        Returns:
+            Pipeline event dict, or None for unhandled VAD events
+        """
         event_type = vad_result.get('event')
 
         if event_type == 'speech_start':
@@ -173,7 +257,7 @@ class AudioPipeline:
     async def process_audio_frame_with_partial(
         self,
         audio_frame: bytes
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[PipelineEvent]:
         """
         Enhanced audio processing with partial transcription support.
 
@@ -207,17 +291,7 @@ class AudioPipeline:
 
         # Handle VAD events
         if vad_result:
-            event_type = vad_result.get('event')
-
-            if event_type == 'speech_start':
-                pre_roll_data = vad_result.get('pre_roll')
-                timestamp_ms = vad_result.get('timestamp_ms')  # Task 11.1
-                return await self._handle_speech_start(pre_roll_data, timestamp_ms)
-
-            elif event_type == 'speech_end':
-                segment_data = vad_result.get('segment', {})
-                timestamp_ms = vad_result.get('timestamp_ms')  # Task 11.1
-                return await self._handle_speech_end(segment_data, timestamp_ms)
+            return await self._handle_vad_event(vad_result)
 
         return None
 
@@ -263,7 +337,7 @@ class AudioPipeline:
         self,
         pre_roll: Optional[bytes] = None,
         timestamp_ms: Optional[int] = None
-    ) -> Dict[str, Any]:
+    ) -> PipelineEvent:
         """
         Handle speech start event.
 
@@ -300,7 +374,7 @@ class AudioPipeline:
         self,
         segment_data: Dict,
         timestamp_ms: Optional[int] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[PipelineEvent]:
         """
         Handle speech end event and generate final transcription.
 
@@ -387,7 +461,7 @@ class AudioPipeline:
                 'segment': segment_data
             }
 
-    async def _generate_partial_transcription(self) -> Optional[Dict[str, Any]]:
+    async def _generate_partial_transcription(self) -> Optional[PipelineEvent]:
         """
         Generate partial transcription for accumulated speech.
 
@@ -482,7 +556,7 @@ class AudioPipeline:
     async def process_audio_stream(
         self,
         audio_stream: AsyncGenerator[bytes, None]
-    ) -> AsyncGenerator[Dict[str, Any], None]:
+    ) -> AsyncGenerator[PipelineEvent, None]:
         """
         Process continuous audio stream.
 
@@ -513,10 +587,36 @@ class AudioPipeline:
         self._running = False
         logger.info("Pipeline stop requested")
 
+    def reset(self):
+        """
+        Discard in-progress speech state so the pipeline can be reused.
+
+        Clears the speech buffer, partial timing and latency timestamps, and
+        resets the VAD's onset/offset state. Statistics are kept.
+        """
+        self._current_speech_buffer = bytearray()
+        self._speech_start_time = None
+        self._last_partial_time = None
+        self._frame_count_since_partial = 0
+        self._speech_start_timestamp_ms = None
+        self._speech_end_timestamp_ms = None
+
+        if self.vad:
+            self.vad.reset()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get pipeline statistics."""
         return self.stats.copy()
 
+    def get_stats_view(self) -> Mapping[str, Any]:
+        """
+        Get a read-only live view of pipeline statistics.
+
+        Unlike get_stats(), nothing is copied: the view reflects later updates,
+        which suits frequent polling by read-only consumers.
+        """
+        return MappingProxyType(self.stats)
+
     def is_in_speech(self) -> bool:
         """
         Check if currently in speech state (VAD detected voice).
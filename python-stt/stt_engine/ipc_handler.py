@@ -10,16 +10,43 @@ Requirements:
 """
 
 import asyncio
+import io
 import json
+import os
+import select
+import stat
 import sys
 import logging
-from typing import Dict, Any, Optional, Callable, Awaitable
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
 from asyncio import StreamReader, StreamWriter
 import time
 
 logger = logging.getLogger(__name__)
 
 
+# _encode_line() returns a complete newline-delimited message as bytes.
+# orjson is optional; it serializes straight to compact UTF-8 bytes (skipping
+# the separate str -> bytes encode step of the stdlib encoder), appends the
+# delimiter itself, and parses incoming lines several times faster than json.loads
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+    def _encode_line(message: Dict[str, Any]) -> bytes:
+        return orjson.dumps(message, option=_ORJSON_OPTIONS)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    _decode_message = orjson.loads
+except ImportError:
+    _decode_message = json.loads
+
+    def _encode_line(message: Dict[str, Any]) -> bytes:
+        # ensure_ascii (the default) guarantees pure ASCII output, so the
+        # ASCII codec's memcpy fast path applies
+        return json.dumps(message, separators=(',', ':')).encode('ascii') + b'\n'
+
+
 class IpcProtocolError(Exception):
     """IPC protocol specific errors"""
     pass
@@ -40,6 +67,13 @@ class IpcHandler:
     - Timeout protection
     - Buffer overflow prevention
     - Graceful error handling
+
+    Wire format:
+        One compact UTF-8 JSON object per line. The Rust side
+        (python_sidecar.rs, sidecar.rs, commands.rs) reads frames with
+        BufRead::read_line, so any change to the framing (e.g. a
+        length-prefixed binary encoding) must land together with the Rust
+        reader and a PROTOCOL_VERSION bump (STT-REQ-007).
     """
 
     # Protocol version (STT-REQ-007.2)
@@ -52,6 +86,14 @@ class IpcHandler:
     # Timeout settings
     DEFAULT_TIMEOUT_SEC = 10.0
 
+    # Output coalescing for high-rate, latency-tolerant events: these are held
+    # for up to COALESCE_DELAY_SEC (or until COALESCE_MAX_BYTES accumulate) and
+    # written together with whatever is sent next. All other messages
+    # (ready, responses, errors, final_text, ...) are written immediately.
+    COALESCED_EVENT_TYPES = frozenset({"partial_text"})
+    COALESCE_DELAY_SEC = 0.005
+    COALESCE_MAX_BYTES = 64 * 1024
+
     def __init__(
         self,
         message_handler: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
@@ -71,6 +113,18 @@ class IpcHandler:
         self._writer: Optional[StreamWriter] = None
         self._buffer = bytearray()
 
+        # Resolved lazily for the current sys.stdout object (see _bind_stdout)
+        self._stdout_obj: Any = None
+        self._stdout_fd: Optional[int] = None
+        self._stdout_flush: Optional[Callable[[], None]] = None
+        self._buffer_write: Optional[Callable[[bytes], int]] = None
+        self._buffer_flush: Optional[Callable[[], None]] = None
+
+        # Pending coalesced output and its flush timer (pipe output only)
+        self._pending_out = bytearray()
+        self._pending_count = 0
+        self._pending_flush: Optional[asyncio.TimerHandle] = None
+
         # Statistics for monitoring
         self.stats = {
             "messages_sent": 0,
@@ -101,23 +155,23 @@ class IpcHandler:
             if "timestamp" not in message:
                 message["timestamp"] = int(time.time() * 1000)
 
-            # Serialize to JSON with compact encoding
-            json_str = json.dumps(message, separators=(',', ':'))
+            # Serialize to compact UTF-8 JSON with newline delimiter
+            data = _encode_line(message)
 
-            # Check message size
-            if len(json_str) > self.MAX_MESSAGE_SIZE:
+            # Check message size (excluding the delimiter)
+            if len(data) - 1 > self.MAX_MESSAGE_SIZE:
                 raise IpcProtocolError(
-                    f"Message too large: {len(json_str)} bytes > {self.MAX_MESSAGE_SIZE} bytes"
+                    f"Message too large: {len(data) - 1} bytes > {self.MAX_MESSAGE_SIZE} bytes"
                 )
 
-            # Add newline delimiter
-            data = (json_str + '\n').encode('utf-8')
-
-            # Write to stdout with timeout
-            sys.stdout.buffer.write(data)
-            sys.stdout.buffer.flush()
-
-            self.stats["messages_sent"] += 1
+            coalesce = (
+                message.get("type") == "event"
+                and message.get("eventType") in self.COALESCED_EVENT_TYPES
+            )
+            # Coalesced messages are counted once they are actually written
+            # (_write_stdout may bump the counter itself, hence the local)
+            written = self._write_stdout(data, coalesce=coalesce)
+            self.stats["messages_sent"] += written
             logger.debug(f"Sent message: type={message.get('type')}, size={len(data)} bytes")
 
         except Exception as e:
@@ -125,6 +179,133 @@ class IpcHandler:
             logger.error(f"Failed to send message: {e}")
             raise IpcProtocolError(f"Send failed: {e}") from e
 
+    def _bind_stdout(self, stdout: Any) -> None:
+        """
+        Resolve the write path for a sys.stdout object once.
+
+        Caches stdout's fd if it is a pipe (so the fstat() runs once, not on
+        every message) and the bound write/flush methods, so the send path
+        does not re-resolve the sys -> stdout -> buffer attribute chain.
+        """
+        self._stdout_obj = stdout
+        self._stdout_fd = None
+        try:
+            fd = stdout.fileno()
+            # isinstance guard: stand-in objects may return non-int "fds"
+            if isinstance(fd, int) and stat.S_ISFIFO(os.fstat(fd).st_mode):
+                self._stdout_fd = fd
+        except (AttributeError, TypeError, ValueError, OSError, io.UnsupportedOperation):
+            # Replaced stdout without a real fd (e.g. test capture)
+            pass
+
+        self._stdout_flush = stdout.flush
+        buffer = getattr(stdout, "buffer", None)
+        self._buffer_write = buffer.write if buffer is not None else None
+        self._buffer_flush = buffer.flush if buffer is not None else None
+
+    def _write_stdout(self, data: bytes, coalesce: bool = False) -> int:
+        """
+        Write one encoded message to stdout.
+
+        When stdout is the pipe to the Rust parent, the message goes out with
+        a single os.write() (atomic for messages up to PIPE_BUF), bypassing the
+        BufferedWriter's separate write + flush. Otherwise falls back to the
+        buffered path.
+
+        Args:
+            data: Encoded, newline-terminated message
+            coalesce: Hold the message briefly so bursts of events share one
+                      write() (pipe output only)
+
+        Returns:
+            Number of messages written, including queued ones sent ahead of
+            data (0 if data itself was queued)
+        """
+        if sys.stdout is not self._stdout_obj:
+            # Queued events belong to the stdout they were queued for
+            self._flush_pending()
+            self._bind_stdout(sys.stdout)
+
+        fd = self._stdout_fd
+        if coalesce and fd is not None:
+            self._pending_out += data
+            self._pending_count += 1
+            if len(self._pending_out) >= self.COALESCE_MAX_BYTES:
+                self._flush_pending()
+            elif self._pending_flush is None:
+                self._pending_flush = asyncio.get_running_loop().call_later(
+                    self.COALESCE_DELAY_SEC, self._flush_pending
+                )
+            return 0
+
+        count = 1
+        if self._pending_out:
+            # Preserve ordering: queued events go out first, in the same write
+            pending, pending_count = self._take_pending()
+            data = pending + data
+            count += pending_count
+
+        if fd is None:
+            self._buffer_write(data)
+            self._buffer_flush()
+        else:
+            self._write_fd(fd, data)
+        return count
+
+    def _cancel_pending_flush(self) -> None:
+        """Cancel the coalesced output's flush timer, if armed."""
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+
+    def _take_pending(self) -> Tuple[bytes, int]:
+        """Detach the coalesced output (and its message count) and cancel its flush timer."""
+        self._cancel_pending_flush()
+        data = bytes(self._pending_out)
+        count = self._pending_count
+        self._pending_out.clear()
+        self._pending_count = 0
+        return data, count
+
+    def _flush_pending(self) -> None:
+        """Write out any coalesced messages."""
+        if self._stdout_fd is None:
+            # No pipe to write to; the buffered path sends leftovers ahead of
+            # the next message
+            self._cancel_pending_flush()
+            return
+        data, count = self._take_pending()
+        if not data:
+            return
+        try:
+            self._write_fd(self._stdout_fd, data)
+            self.stats["messages_sent"] += count
+        except Exception as e:
+            # Runs from a timer callback, so there is no caller to raise to
+            self.stats["errors"] += 1
+            logger.error(f"Failed to flush coalesced messages: {e}")
+
+    def _write_fd(self, fd: int, data: bytes) -> None:
+        """Write all of data to fd, resuming partial writes."""
+        # Keep ordering with anything still sitting in Python's stdout buffers
+        self._stdout_flush()
+        try:
+            written = os.write(fd, data)
+        except BlockingIOError:
+            written = 0
+        if written == len(data):
+            return
+
+        # Partial write (message larger than the pipe's free space)
+        view = memoryview(data)[written:]
+        while view:
+            try:
+                written = os.write(fd, view)
+            except BlockingIOError:
+                select.select([], [fd], [])
+                continue
+            view = view[written:]
+
     async def receive_message(self) -> Optional[Dict[str, Any]]:
         """
         Receive a message from the Rust parent process via stdin.
@@ -147,7 +328,7 @@ class IpcHandler:
                 return None
 
             # Parse JSON
-            message = json.loads(line)
+            message = _decode_message(line)
 
             # Validate message structure
             if not isinstance(message, dict):
@@ -247,6 +428,7 @@ class IpcHandler:
 
         finally:
             self._running = False
+            self._flush_pending()
             logger.info(f"IpcHandler stopped. Stats: {self.stats}")
 
     async def stop(self) -> None:
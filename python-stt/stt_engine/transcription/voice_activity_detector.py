@@ -70,6 +70,18 @@ class VoiceActivityDetector:
             f"aggressiveness={aggressiveness}, pre_roll_buffer={self.speech_onset_threshold} frames"
         )
 
+    def reset(self) -> None:
+        """
+        Return to the initial (not in speech) state.
+
+        Drops the current segment and pre-roll frames without emitting an event.
+        """
+        self.is_in_speech = False
+        self.speech_frames = 0
+        self.silence_frames = 0
+        self.current_segment = []
+        self.pre_roll_buffer.clear()
+
     def split_into_frames(self, audio_data: bytes) -> List[bytes]:
         """
         Split audio data into 10ms frames.
@@ -12,27 +12,124 @@ Requirements:
 
 import sys
 import json
+import asyncio
+import bisect
+import io
+import select
 import logging
 import psutil
+import numpy as np
 import os
+import gc
+import time
+import threading
+import importlib.util
 from pathlib import Path
-from typing import Literal, Optional, Dict, Union
-from faster_whisper import WhisperModel
+from typing import Any, Iterable, Literal, Optional, Dict, List, Tuple, Union
+
+# hf_transfer speeds up Hub downloads; huggingface_hub reads this flag at import
+# time and errors if it is set without the package, so only opt in when present.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# torch is optional and only used for GPU detection; probe for it once without
+# paying its (multi-second) import cost at module load
+_TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+
+from huggingface_hub import constants as hf_constants
+from huggingface_hub import snapshot_download, try_to_load_from_cache
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 # Type definition for model sizes (STT-REQ-002.2)
 ModelSize = Literal["tiny", "base", "small", "medium", "large-v3"]
 
+# faster-whisper expects 16kHz mono float32 input
+_WHISPER_SAMPLE_RATE = 16000
+
+# int16 PCM → float32 [-1.0, 1.0] scale factor
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+# Longest clip the batched pipeline transcribes without truncation
+_MAX_BATCH_CLIP_SECONDS = 30.0
+
+# Default silence gate: RMS of ~200 int16 units is around the noise floor of
+# typical 16-bit microphone input
+_DEFAULT_SILENCE_RMS = 200
+
+# Files faster-whisper needs from a Systran/faster-whisper-* repo
+# (same allow-list as faster_whisper.utils.download_model)
+_HUB_ALLOW_PATTERNS = [
+    "config.json",
+    "preprocessor_config.json",
+    "model.bin",
+    "tokenizer.json",
+    "vocabulary.*",
+]
+
+
+def _hub_repo_id(model_size: str) -> str:
+    return f"Systran/faster-whisper-{model_size}"
+
+
 logger = logging.getLogger(__name__)
 
 
+# orjson is optional; it serializes structured log records several times
+# faster than the stdlib encoder (and handles NumPy scalars in details)
+try:
+    import orjson
+
+    def _dumpb(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return _dumpb(payload).decode("utf-8")
+except ImportError:
+    def _dumps(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, ensure_ascii=False)
+
+    def _dumpb(payload: Dict[str, Any]) -> bytes:
+        return _dumps(payload).encode("utf-8")
+
+
+def _write_stdout_line(data: bytes) -> None:
+    """
+    Write a pre-serialized, newline-terminated message directly to fd 1.
+
+    Bypasses the TextIOWrapper encode/flush path. Partial writes are resumed,
+    and if the parent's pipe is full (EAGAIN) we wait for it to drain.
+    """
+    # Keep ordering with anything still sitting in Python's stdout buffers
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        # stdout replaced by an object without a real fd (e.g. in-process capture)
+        sys.stdout.write(data.decode("utf-8"))
+        sys.stdout.flush()
+        return
+
+    view = memoryview(data)
+    while view:
+        try:
+            written = os.write(fd, view)
+        except BlockingIOError:
+            select.select([], [fd], [])
+            continue
+        view = view[written:]
+
+
 def _log_structured(level: int, component: str, event: str, **details) -> None:
+    # Skip payload construction entirely when the level is disabled
+    if not logger.isEnabledFor(level):
+        return
     payload = {
         "component": component,
         "event": event,
     }
     if details:
         payload["details"] = details
-    logger.log(level, json.dumps(payload, ensure_ascii=False))
+    logger.log(level, _dumps(payload))
 
 
 def log_info_event(component: str, event: str, **details) -> None:
@@ -47,6 +144,13 @@ def log_error_event(component: str, event: str, **details) -> None:
     _log_structured(logging.ERROR, component, event, **details)
 
 
+def _fail_pending(futures: Iterable[asyncio.Future]) -> None:
+    """Fail micro-batch request futures that will never be served."""
+    for future in futures:
+        if not future.done():
+            future.set_exception(RuntimeError("WhisperSTTEngine closed"))
+
+
 class WhisperSTTEngine:
     """
     WhisperSTTEngine handles audio transcription using faster-whisper.
@@ -61,7 +165,11 @@ class WhisperSTTEngine:
         self,
         model_size: Optional[ModelSize] = None,
         auto_select_model: bool = False,
-        offline_mode: bool = False
+        offline_mode: bool = False,
+        max_batch_size: int = 1,
+        batch_window_ms: float = 5.0,
+        silence_threshold: int = _DEFAULT_SILENCE_RMS,
+        beam_size: int = 5
     ):
         """
         Initialize WhisperSTTEngine with specified or auto-selected model size.
@@ -73,22 +181,61 @@ class WhisperSTTEngine:
                               system resources (unless model_size is explicitly provided)
             offline_mode: If True, skip HuggingFace Hub downloads and use only
                          cached or bundled models (STT-REQ-002.6)
+            max_batch_size: Maximum number of concurrent transcribe() calls
+                           coalesced into one batched CTranslate2 call
+                           (1 disables micro-batching)
+            batch_window_ms: How long the batch worker waits for more
+                            requests after the first one arrives
+            silence_threshold: RMS level (in int16 units) below which a chunk
+                              is treated as silence and Whisper is skipped
+                              (0 disables the check)
+            beam_size: Beam width used for final transcriptions
+                      (partials always decode greedily)
         """
         self.model: Optional[WhisperModel] = None
         self.model_path: Optional[str] = None
         self.offline_mode: bool = offline_mode
         self._download_timeout: int = 10  # seconds (STT-REQ-002.3)
+        self._bundled_scan_cache: Optional[List[Dict[str, Path]]] = None
+        self._user_config_cache: Optional[Tuple[Tuple[str, int, int], str]] = None
+        self._hub_snapshot_cache: Dict[Tuple[str, str], str] = {}
+        self._teardown_slot = threading.BoundedSemaphore(1)
+        self._resources: Optional[Dict[str, Union[int, float, bool]]] = None
+        # Compared against the mean square so no sqrt is needed per chunk
+        self._silence_mean_square: int = max(0, silence_threshold) ** 2
+        # Decoding options, built once and shared by every model.transcribe() call.
+        # Finals use beam search; partials are re-decoded on every streaming update
+        # and overwritten by the final, so they use cheaper greedy decoding.
+        self._beam_kwargs: Dict[str, Any] = {
+            "language": "ja",  # Japanese language hint
+            "vad_filter": False,  # VAD handled separately in Task 4
+        }
+        self._greedy_kwargs: Dict[str, Any] = {
+            "language": "ja",
+            "vad_filter": False,
+            "beam_size": 1,
+            "best_of": 1,
+            "temperature": [0.0],  # no temperature fallback re-decodes
+        }
+        self.beam_size = beam_size
+
+        # Micro-batching of concurrent transcribe() calls (disabled when max_batch_size == 1)
+        self._max_batch_size: int = max(1, max_batch_size)
+        self._batch_window_s: float = batch_window_ms / 1000.0
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_worker_task: Optional[asyncio.Task] = None
+        self._batched_pipeline: Optional[BatchedInferencePipeline] = None
 
         # Auto-select model if enabled and no explicit model_size provided
         if auto_select_model and model_size is None:
-            resources = self._detect_system_resources()
+            resources = self._get_system_resources()
             self.model_size = self._select_model_by_resources(resources)
             logger.info(f"Auto-selected model based on system resources: {self.model_size}")
         elif model_size is not None:
             self.model_size = model_size
             # Check if manually selected model exceeds resources (STT-REQ-006.5)
             if auto_select_model:
-                resources = self._detect_system_resources()
+                resources = self._get_system_resources()
                 if self._check_model_exceeds_resources(model_size, resources):
                     logger.warning(
                         f"Manually selected model '{model_size}' may exceed system resources. "
@@ -100,6 +247,17 @@ class WhisperSTTEngine:
 
         logger.info(f"WhisperSTTEngine initialized with model_size={self.model_size}")
 
+    @property
+    def beam_size(self) -> int:
+        """Beam width passed to faster-whisper for final transcriptions."""
+        return self._beam_kwargs["beam_size"]
+
+    @beam_size.setter
+    def beam_size(self, value: int) -> None:
+        if value < 1:
+            raise ValueError(f"beam_size must be >= 1, got {value}")
+        self._beam_kwargs["beam_size"] = value
+
     def _get_proxy_settings(self) -> Dict[str, str]:
         """
         Get proxy settings from environment variables (STT-REQ-002.7).
@@ -138,35 +296,30 @@ class WhisperSTTEngine:
             model_size: Model size to download
 
         Returns:
-            Path to downloaded model, or None if download failed
+            Path to downloaded model snapshot, or None if download failed
 
         Note:
             - Timeout: 10 seconds (STT-REQ-002.3)
-            - Respects proxy settings (STT-REQ-002.7)
+            - Respects proxy settings (STT-REQ-002.7, via HTTPS_PROXY/HTTP_PROXY)
             - Logs download progress (STT-REQ-002.8)
+            - Cache location follows HF_HOME / HF_HUB_CACHE
         """
         if self.offline_mode:
             logger.info("Offline mode enabled, skipping HuggingFace Hub download")
             return None
 
+        repo_id = _hub_repo_id(model_size)
         try:
             self._log_download_progress(f"Attempting to download {model_size} model from HuggingFace Hub...")
 
-            # Check if model is already cached
-            hf_cache_base = Path.home() / ".cache" / "huggingface" / "hub"
-            model_name_in_cache = f"models--Systran--faster-whisper-{model_size}"
-            cached_model_path = hf_cache_base / model_name_in_cache
-
-            if cached_model_path.exists():
-                self._log_download_progress(f"Model found in cache: {cached_model_path}")
-                return str(cached_model_path)
-
-            # Try to download with timeout
-            # Note: faster-whisper's WhisperModel handles downloading automatically
-            # We'll rely on the model loading in initialize() with appropriate timeout
-            self._log_download_progress(f"Model not in cache, will download on first use")
+            snapshot_path = snapshot_download(
+                repo_id=repo_id,
+                allow_patterns=_HUB_ALLOW_PATTERNS,
+                etag_timeout=self._download_timeout,
+            )
 
-            return None  # Let WhisperModel handle the download
+            self._log_download_progress(f"Model downloaded to: {snapshot_path}")
+            return snapshot_path
 
         except TimeoutError as e:
             logger.warning(f"HuggingFace Hub download timeout after {self._download_timeout}s: {e}")
@@ -175,6 +328,110 @@ class WhisperSTTEngine:
             logger.warning(f"HuggingFace Hub download failed: {e}")
             return None
 
+    def _lookup_hub_cache(self, model_size: ModelSize) -> Optional[str]:
+        """
+        Look up a cached Hub snapshot without touching the network (STT-REQ-002.1).
+
+        Args:
+            model_size: Model size to look up
+
+        Returns:
+            Snapshot directory containing model.bin, or None if not cached
+
+        Note:
+            - Resolves refs/main to the pinned snapshot instead of guessing
+            - Honors HF_HOME / HF_HUB_CACHE (e.g. shared NFS caches)
+            - Hits are memoized and revalidated with a single stat of model.bin
+        """
+        cache_key = (str(hf_constants.HF_HUB_CACHE), model_size)
+        snapshot = self._hub_snapshot_cache.get(cache_key)
+        if snapshot is not None and os.path.isfile(os.path.join(snapshot, "model.bin")):
+            return snapshot
+
+        cached = try_to_load_from_cache(repo_id=_hub_repo_id(model_size), filename="model.bin")
+        if isinstance(cached, str):
+            snapshot = str(Path(cached).parent)
+            self._hub_snapshot_cache[cache_key] = snapshot
+            return snapshot
+
+        self._hub_snapshot_cache.pop(cache_key, None)
+        return None
+
+    def _read_user_model_path(self, user_config_path: Path) -> Optional[str]:
+        """
+        Read the user-specified model path (STT-REQ-002.1 priority 1).
+
+        Args:
+            user_config_path: Path of the whisper_model_path config file
+
+        Returns:
+            Configured model path (stripped), or None if the file doesn't exist
+
+        Note:
+            The file is only re-read when its mtime/size changes, so repeated
+            load_model() calls cost a single stat().
+        """
+        try:
+            st = os.stat(user_config_path)
+        except OSError:
+            self._user_config_cache = None
+            return None
+
+        key = (str(user_config_path), st.st_mtime_ns, st.st_size)
+        if self._user_config_cache is not None and self._user_config_cache[0] == key:
+            return self._user_config_cache[1]
+
+        with open(user_config_path, 'r') as f:
+            custom_path = f.read().strip()
+
+        self._user_config_cache = (key, custom_path)
+        return custom_path
+
+    def _bundled_base_dirs(self) -> List[Path]:
+        """
+        Candidate installation directories for bundled models, in priority order.
+
+        Returns:
+            List of base directories that may contain <model_size>/model.bin
+        """
+        return [
+            Path(__file__).parent.parent.parent / "models" / "faster-whisper",
+            Path.home() / ".local" / "share" / "meeting-minutes-automator" / "models" / "faster-whisper",
+            Path("/opt/meeting-minutes-automator/models/faster-whisper"),
+        ]
+
+    def _scan_bundled_models(self) -> List[Dict[str, Path]]:
+        """
+        Scan each bundled base directory once and cache usable model directories.
+
+        Returns:
+            One dict per base directory (same order as _bundled_base_dirs())
+            mapping model size to its directory, limited to entries with model.bin
+
+        Note:
+            - Each base directory is listed with a single os.scandir() pass
+            - The result is memoized; bundled models are install-time artifacts,
+              so load_model() reuses the scan instead of probing the disk again
+        """
+        if self._bundled_scan_cache is not None:
+            return self._bundled_scan_cache
+
+        scan: List[Dict[str, Path]] = []
+        for base_dir in self._bundled_base_dirs():
+            models: Dict[str, Path] = {}
+            try:
+                with os.scandir(base_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "model.bin")):
+                            models[entry.name] = Path(entry.path)
+            except OSError:
+                # Missing or unreadable base directory
+                pass
+            scan.append(models)
+
+        self._bundled_scan_cache = scan
+        return scan
+
     def _detect_bundled_model_path(self, requested_size: ModelSize) -> Optional[str]:
         """
         Detect bundled model path with fallback to 'base' (STT-REQ-002.4).
@@ -187,28 +444,23 @@ class WhisperSTTEngine:
 
         Note:
             - Updates self.model_size to 'base' if fallback occurs
-            - Checks multiple installation directories
+            - Checks multiple installation directories (scanned once, see _scan_bundled_models)
         """
-        # Candidate directories for bundled models
-        bundled_base_dirs = [
-            Path(__file__).parent.parent.parent / "models" / "faster-whisper",
-            Path.home() / ".local" / "share" / "meeting-minutes-automator" / "models" / "faster-whisper",
-            Path("/opt/meeting-minutes-automator/models/faster-whisper"),
-        ]
+        bundled_models = self._scan_bundled_models()
 
         # First, try the requested model size
-        for base_dir in bundled_base_dirs:
-            bundled_path = base_dir / requested_size
-            if bundled_path.exists() and (bundled_path / "model.bin").exists():
+        for models in bundled_models:
+            bundled_path = models.get(requested_size)
+            if bundled_path is not None:
                 logger.info(f"Using bundled model: {bundled_path}")
                 return str(bundled_path)
 
         # STT-REQ-002.4: If requested size not found, fallback to bundled 'base' model
         if requested_size != 'base':
             logger.warning(f"Requested model '{requested_size}' not found in bundle, falling back to 'base'")
-            for base_dir in bundled_base_dirs:
-                bundled_base_path = base_dir / "base"
-                if bundled_base_path.exists() and (bundled_base_path / "model.bin").exists():
+            for models in bundled_models:
+                bundled_base_path = models.get("base")
+                if bundled_base_path is not None:
                     logger.info(f"Using bundled fallback model: {bundled_base_path}")
                     # Update model_size to reflect actual model being loaded
                     self.model_size = "base"
@@ -257,13 +509,14 @@ class WhisperSTTEngine:
         gpu_memory_gb = 0
 
         try:
-            import torch
-            if torch.cuda.is_available():
-                has_gpu = True
-                # Get GPU memory in GB
-                gpu_memory_gb = torch.cuda.get_device_properties(0).total_memory / (1024 ** 3)
+            # torch availability checked once at import; without it, assume no GPU
+            if _TORCH_AVAILABLE:
+                import torch
+                if torch.cuda.is_available():
+                    has_gpu = True
+                    # Get GPU memory in GB
+                    gpu_memory_gb = torch.cuda.get_device_properties(0).total_memory / (1024 ** 3)
         except ImportError:
-            # torch not available, assume no GPU
             pass
         except Exception as e:
             logger.debug(f"resource_monitor.gpu_detection_failed: {e}")
@@ -278,6 +531,33 @@ class WhisperSTTEngine:
         logger.info(f"Detected system resources: {resources}")
         return resources
 
+    def _get_system_resources(self) -> Dict[str, Union[int, float, bool]]:
+        """
+        Return system resources, detecting them on first use only.
+
+        Returns:
+            Dict from _detect_system_resources() (cached for the engine lifetime)
+        """
+        if self._resources is None:
+            self._resources = self._detect_system_resources()
+        return self._resources
+
+    def _pick_backend(self, resources: Dict[str, Union[int, float, bool]]) -> Tuple[str, str, int]:
+        """
+        Choose the CTranslate2 device and compute type for the detected hardware.
+
+        Args:
+            resources: System resource information from _detect_system_resources()
+
+        Returns:
+            Tuple of (device, compute_type, cpu_threads):
+                - GPU → ("cuda", "int8_float16", 0)
+                - CPU → ("cpu", "int8", cpu_cores)
+        """
+        if resources['has_gpu']:
+            return "cuda", "int8_float16", 0
+        return "cpu", "int8", int(resources['cpu_cores'])
+
     def _select_model_by_resources(self, resources: Dict[str, Union[int, float, bool]]) -> ModelSize:
         """
         Select optimal Whisper model based on system resources (STT-REQ-006.2, STT-REQ-006.3).
@@ -375,8 +655,8 @@ class WhisperSTTEngine:
         """
         Detect model path following priority order (STT-REQ-002.1, STT-REQ-002.4, STT-REQ-002.6):
         1. User-specified path (~/.config/meeting-minutes-automator/whisper_model_path)
-        2. HuggingFace Hub cache (~/.cache/huggingface/hub/models--Systran--faster-whisper-*)
-        3. HuggingFace Hub model ID (online mode - triggers auto-download)
+        2. HuggingFace Hub cache (resolved via huggingface_hub, honors HF_HOME)
+        3. HuggingFace Hub download (online mode - snapshot_download, model ID on failure)
         4. Bundled model (offline mode only - multiple installation paths checked)
         5. Error (offline mode with no bundled model)
 
@@ -388,46 +668,28 @@ class WhisperSTTEngine:
         """
         # Priority 1: User-specified path
         user_config_path = Path.home() / ".config" / "meeting-minutes-automator" / "whisper_model_path"
-        if user_config_path.exists():
-            with open(user_config_path, 'r') as f:
-                custom_path = f.read().strip()
-                if Path(custom_path).exists():
-                    logger.info(f"Using user-specified model path: {custom_path}")
-                    return custom_path
-
-        # Priority 2: HuggingFace Hub cache
-        hf_cache_base = Path.home() / ".cache" / "huggingface" / "hub"
-        model_name_in_cache = f"models--Systran--faster-whisper-{self.model_size}"
-        hf_model_dir = hf_cache_base / model_name_in_cache
-
-        if hf_model_dir.exists():
-            # HuggingFace cache uses snapshots/<hash>/ structure
-            # Find the latest snapshot
-            snapshots_dir = hf_model_dir / "snapshots"
-            if snapshots_dir.exists():
-                snapshots = list(snapshots_dir.iterdir())
-                if snapshots:
-                    # Use the first (and typically only) snapshot
-                    snapshot_path = snapshots[0]
-                    logger.info(f"Using HuggingFace cache model: {snapshot_path}")
-                    return str(snapshot_path)
-
-            # Fallback: use the model directory directly (older cache format)
-            logger.info(f"Using HuggingFace cache model: {hf_model_dir}")
-            return str(hf_model_dir)
-
-        # Priority 3: HuggingFace Hub model ID (online mode - STT-REQ-002.1/002.3)
+        custom_path = self._read_user_model_path(user_config_path)
+        if custom_path and Path(custom_path).exists():
+            logger.info(f"Using user-specified model path: {custom_path}")
+            return custom_path
+
+        # Priority 2: HuggingFace Hub cache (refs/main → snapshots/<hash>/)
+        cached_snapshot = self._lookup_hub_cache(self.model_size)
+        if cached_snapshot:
+            logger.info(f"Using HuggingFace cache model: {cached_snapshot}")
+            return cached_snapshot
+
+        # Priority 3: HuggingFace Hub download (online mode - STT-REQ-002.1/002.3)
         # In online mode, prefer downloading from Hub over bundled fallback
         if not self.offline_mode:
-            # Check if already in cache (quick check)
             downloaded_path = self._try_download_from_hub(self.model_size)
             if downloaded_path:
-                logger.info(f"Using cached model from Hub: {downloaded_path}")
+                logger.info(f"Using downloaded model from Hub: {downloaded_path}")
                 return downloaded_path
 
-            # Not in cache, return Hub model ID to trigger auto-download
-            # This ensures we download the requested model size before falling back to bundled
-            model_id = f"Systran/faster-whisper-{self.model_size}"
+            # Download failed, return Hub model ID so WhisperModel retries and
+            # initialize() can still fall back to the bundled model (STT-REQ-002.4)
+            model_id = _hub_repo_id(self.model_size)
             logger.info(f"Using HuggingFace Hub model ID: {model_id} (will auto-download)")
             return model_id
 
@@ -442,11 +704,55 @@ class WhisperSTTEngine:
             f"No Whisper model found for '{self.model_size}' in offline mode. "
             f"Checked locations:\n"
             f"  - User config: {user_config_path}\n"
-            f"  - HuggingFace cache: {hf_cache_base / model_name_in_cache}\n"
+            f"  - HuggingFace cache: {hf_constants.HF_HUB_CACHE} ({_hub_repo_id(self.model_size)})\n"
             f"  - Bundled model directories (see _detect_bundled_model_path)\n"
             f"Please download the model manually or run in online mode."
         )
 
+    def _load_whisper_model(self, model_path: str) -> WhisperModel:
+        """
+        Construct a WhisperModel for the resolved model path.
+
+        Args:
+            model_path: Local model directory or HuggingFace Hub model ID
+
+        Returns:
+            WhisperModel: Loaded model
+
+        Note:
+            local_files_only=True is passed whenever the path is already on disk
+            (or offline mode is enabled) so huggingface_hub never issues the
+            revision HEAD request against the Hub (STT-REQ-002.6).
+            Device and compute type come from _pick_backend(); a failed GPU
+            load is retried on CPU.
+        """
+        local_files_only = self.offline_mode or os.path.isdir(model_path)
+        resources = self._get_system_resources()
+        device, compute_type, cpu_threads = self._pick_backend(resources)
+
+        try:
+            return WhisperModel(
+                model_path,
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=1,
+                local_files_only=local_files_only
+            )
+        except Exception as e:
+            if device == "cpu":
+                raise
+            # CTranslate2 build without CUDA support, or driver mismatch
+            logger.warning(f"Failed to load model on {device} ({compute_type}): {e}; retrying on CPU")
+            return WhisperModel(
+                model_path,
+                device="cpu",
+                compute_type="int8",
+                cpu_threads=int(resources['cpu_cores']),
+                num_workers=1,
+                local_files_only=local_files_only
+            )
+
     async def initialize(self) -> None:
         """
         Initialize the WhisperSTTEngine by loading the faster-whisper model.
@@ -475,11 +781,7 @@ class WhisperSTTEngine:
             logger.info(f"Loading faster-whisper model: {self.model_size}")
 
             try:
-                self.model = WhisperModel(
-                    self.model_path,
-                    device="cpu",
-                    compute_type="int8"
-                )
+                self.model = self._load_whisper_model(self.model_path)
                 logger.info("WhisperModel loaded successfully")
 
             except Exception as load_error:
@@ -493,11 +795,7 @@ class WhisperSTTEngine:
                         self.model_path = bundled_path
                         logger.info(f"Retrying with bundled model: {self.model_path}")
 
-                        self.model = WhisperModel(
-                            self.model_path,
-                            device="cpu",
-                            compute_type="int8"
-                        )
+                        self.model = self._load_whisper_model(self.model_path)
                         logger.info(f"Successfully loaded bundled fallback: {self.model_path}")
                     else:
                         logger.error("No bundled model available for fallback (STT-REQ-002.5)")
@@ -509,14 +807,13 @@ class WhisperSTTEngine:
                     raise
 
             # Output ready message to stdout (STT-REQ-002.10)
-            ready_message = json.dumps({
+            ready_message = _dumpb({
                 "type": "event",
                 "event": "whisper_model_ready",
                 "model_size": self.model_size,
                 "model_path": self.model_path
             })
-            sys.stdout.write(f"{ready_message}\n")
-            sys.stdout.flush()
+            _write_stdout_line(ready_message + b"\n")
 
             logger.info("WhisperSTTEngine initialization complete")
 
@@ -524,6 +821,36 @@ class WhisperSTTEngine:
             logger.error(f"Failed to initialize WhisperSTTEngine: {e}")
             raise
 
+    def _release_model(self, holder: List[WhisperModel]) -> None:
+        """
+        Release an unloaded model in a background thread (Task 5.2).
+
+        Args:
+            holder: One-element list holding the only remaining reference to a
+                    model that has already been swapped out of self.model. The
+                    caller must not keep any other reference, otherwise the
+                    weights are freed wherever that reference is dropped.
+
+        Note:
+            - faster-whisper doesn't have close() method, relies on GC
+            - At most one teardown runs concurrently to cap peak RSS; if one is
+              still in progress, the model is released inline instead
+        """
+        if not self._teardown_slot.acquire(blocking=False):
+            holder.clear()
+            gc.collect()
+            return
+
+        def _teardown() -> None:
+            try:
+                # Dropping the last reference frees the CT2 weights in this thread
+                holder.clear()
+                gc.collect()
+            finally:
+                self._teardown_slot.release()
+
+        threading.Thread(target=_teardown, name="whisper-model-teardown", daemon=True).start()
+
     async def load_model(self, new_model_size: ModelSize) -> str:
         """
         Dynamically switch to a different model size (Task 5.2, STT-REQ-006.9).
@@ -544,8 +871,6 @@ class WhisperSTTEngine:
         Raises:
             Exception: If model loading fails (after rollback)
         """
-        import gc
-
         logger.info(f"Switching model from {self.model_size} to {new_model_size}")
 
         # Save current state for rollback (CRITICAL: before any modifications)
@@ -567,26 +892,16 @@ class WhisperSTTEngine:
             except (TimeoutError, ConnectionError, OSError) as network_error:
                 # Network error during download attempt
                 logger.warning(f"Network error during model detection: {network_error}")
-                logger.info(f"Attempting fallback to HuggingFace Hub model ID: Systran/faster-whisper-{new_model_size}")
-                self.model_path = f"Systran/faster-whisper-{new_model_size}"
+                self.model_path = _hub_repo_id(new_model_size)
+                logger.info(f"Attempting fallback to HuggingFace Hub model ID: {self.model_path}")
 
             logger.info(f"Loading new model: {new_model_size} from {self.model_path}")
 
             # Load new model (CRITICAL: this can fail)
-            new_model = WhisperModel(
-                self.model_path,
-                device="cpu",
-                compute_type="int8"
-            )
+            new_model = self._load_whisper_model(self.model_path)
 
-            # Success: switch to new model and cleanup old one
+            # Success: switch to new model
             self.model = new_model
-            if old_model is not None:
-                logger.info(f"Unloading old model: {old_model_size}")
-                del old_model
-                # Force garbage collection to release resources
-                # faster-whisper doesn't have close() method, relies on GC
-                gc.collect()
 
             # Log actual loaded model (may differ from requested due to bundled fallback)
             if self.model_size != new_model_size:
@@ -597,9 +912,6 @@ class WhisperSTTEngine:
             else:
                 logger.info(f"Model switch complete: {old_model_size} → {self.model_size}")
 
-            # Return actual loaded model size (STT-REQ-006.9/006.12)
-            return self.model_size
-
         except Exception as e:
             # CRITICAL: Rollback to old model state on ANY failure
             logger.error(f"Failed to load model {new_model_size}: {e}")
@@ -612,6 +924,192 @@ class WhisperSTTEngine:
 
             raise
 
+        # Cleanup old model last, outside the rollback scope. Drop this frame's
+        # reference before the teardown thread starts so that the thread holds
+        # the only one and the new model serves requests without waiting on
+        # the GC sweep.
+        if old_model is not None:
+            logger.info(f"Unloading old model: {old_model_size}")
+            release_holder = [old_model]
+            old_model = None
+            self._release_model(release_holder)
+
+        # Return actual loaded model size (STT-REQ-006.9/006.12)
+        return self.model_size
+
+    async def _submit_to_batch(self, audio_float: np.ndarray, is_final: bool) -> Tuple[list, str]:
+        """
+        Queue audio for the micro-batch worker and wait for its result.
+
+        Args:
+            audio_float: Float32 audio in [-1.0, 1.0] at 16kHz
+            is_final: Whether to decode with beam search (final) or greedily (partial)
+
+        Returns:
+            Tuple of (segments, detected_language) for this audio only
+        """
+        loop = asyncio.get_running_loop()
+
+        # (Re)start the worker on first use or when called from a new event loop
+        if self._batch_worker_task is None or self._batch_worker_task.get_loop() is not loop \
+                or self._batch_worker_task.done():
+            self._batch_queue = asyncio.Queue()
+            self._batch_worker_task = loop.create_task(self._batch_worker())
+
+        future = loop.create_future()
+        await self._batch_queue.put((audio_float, is_final, future))
+        return await future
+
+    async def _batch_worker(self) -> None:
+        """
+        Collect queued transcriptions into batches and run them together.
+
+        The worker waits up to batch_window_ms after the first request for
+        more requests (at most max_batch_size), then resolves each request's
+        future with its own segments.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._batch_queue
+        batch = []
+
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self._batch_window_s
+
+                while len(batch) < self._max_batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Finals and partials use different decoding options, so run them
+                # as separate batched calls
+                for final_group in (True, False):
+                    group = [(audio, future) for audio, is_final, future in batch if is_final is final_group]
+                    if not group:
+                        continue
+                    kwargs = self._beam_kwargs if final_group else self._greedy_kwargs
+                    try:
+                        results = self._transcribe_batch([audio for audio, _ in group], kwargs)
+                    except Exception as e:
+                        for _, future in group:
+                            if not future.done():
+                                future.set_exception(e)
+                    else:
+                        for (_, future), result in zip(group, results):
+                            if not future.done():
+                                future.set_result(result)
+        except asyncio.CancelledError:
+            # Shutdown (close()): fail the requests collected for the unfinished batch
+            _fail_pending(future for _, _, future in batch)
+            raise
+
+    async def close(self) -> None:
+        """
+        Stop the micro-batch worker and fail any transcriptions still queued.
+
+        Call on shutdown from the event loop that used the engine. Safe to call
+        more than once and when batching was never used; a later transcribe()
+        starts a fresh worker.
+        """
+        task, queue = self._batch_worker_task, self._batch_queue
+        self._batch_worker_task = None
+        self._batch_queue = None
+
+        if task is not None and not task.done():
+            task.cancel()
+            if task.get_loop() is asyncio.get_running_loop():
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        if queue is not None:
+            pending = []
+            while not queue.empty():
+                _, _, future = queue.get_nowait()
+                pending.append(future)
+            _fail_pending(pending)
+
+    def _transcribe_batch(
+        self, audios: List[np.ndarray], transcribe_kwargs: Dict[str, Any]
+    ) -> List[Tuple[list, str]]:
+        """
+        Transcribe several audio buffers with a single batched CTranslate2 call.
+
+        Args:
+            audios: Float32 audio buffers at 16kHz
+            transcribe_kwargs: Decoding options (beam or greedy) for all buffers
+
+        Returns:
+            List of (segments, detected_language), one per input buffer
+
+        Note:
+            Buffers are concatenated and passed as clip_timestamps to
+            BatchedInferencePipeline, which encodes/decodes all clips in one
+            batch; segments are routed back by their position in the timeline.
+            Single requests and clips longer than 30s use the regular path.
+        """
+        if len(audios) == 1 or any(len(a) > _MAX_BATCH_CLIP_SECONDS * _WHISPER_SAMPLE_RATE for a in audios):
+            results = []
+            for audio in audios:
+                segments, info = self.model.transcribe(audio, **transcribe_kwargs)
+                results.append((list(segments), info.language if hasattr(info, 'language') else "ja"))
+            return results
+
+        if self._batched_pipeline is None or self._batched_pipeline.model is not self.model:
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+
+        clip_starts = []
+        clip_timestamps = []
+        offset = 0
+        for audio in audios:
+            clip_starts.append(offset / _WHISPER_SAMPLE_RATE)
+            clip_timestamps.append({
+                "start": offset / _WHISPER_SAMPLE_RATE,
+                "end": (offset + len(audio)) / _WHISPER_SAMPLE_RATE,
+            })
+            offset += len(audio)
+
+        segments, info = self._batched_pipeline.transcribe(
+            np.concatenate(audios),
+            **transcribe_kwargs,
+            clip_timestamps=clip_timestamps,
+            batch_size=len(audios),
+        )
+        detected_language = info.language if hasattr(info, 'language') else "ja"
+
+        per_clip: List[list] = [[] for _ in audios]
+        for segment in segments:
+            midpoint = (segment.start + segment.end) / 2
+            index = max(0, bisect.bisect_right(clip_starts, midpoint) - 1)
+            per_clip[index].append(segment)
+
+        return [(clip_segments, detected_language) for clip_segments in per_clip]
+
+    def _is_silent(self, audio_array: np.ndarray) -> bool:
+        """
+        Check whether an int16 PCM chunk is below the silence threshold.
+
+        Uses an integer dot product (int64 accumulator) so the check costs a
+        few microseconds and never touches floating point.
+
+        Args:
+            audio_array: int16 PCM samples
+
+        Returns:
+            bool: True if the chunk's mean square is below the threshold
+        """
+        if self._silence_mean_square == 0 or audio_array.size == 0:
+            return False
+        wide = audio_array.astype(np.int64)
+        energy = int(np.dot(wide, wide))
+        return energy < self._silence_mean_square * audio_array.size
+
     async def transcribe(self, audio_data: bytes, sample_rate: int = 16000, is_final: bool = False) -> dict:
         """
         Transcribe audio data to text using faster-whisper (STT-REQ-002.11, STT-REQ-002.12).
@@ -627,9 +1125,6 @@ class WhisperSTTEngine:
         Raises:
             RuntimeError: If model not initialized
         """
-        import time
-        import numpy as np
-
         if self.model is None:
             raise RuntimeError("WhisperSTTEngine not initialized. Call initialize() first.")
 
@@ -650,9 +1145,22 @@ class WhisperSTTEngine:
 
             # Convert bytes to numpy array (16-bit PCM)
             try:
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
+                if len(audio_data) % 2:
+                    raise ValueError(f"PCM16 buffer has odd length: {len(audio_data)} bytes")
+                # Zero-copy little-endian view (works for bytes, bytearray and memoryview)
+                audio_array = np.frombuffer(audio_data, dtype='<i2', count=len(audio_data) // 2)
+                if self._is_silent(audio_array):
+                    logger.debug(f"Skipping silent chunk: {len(audio_array)} samples")
+                    return {
+                        "text": "",
+                        "confidence": 0.0,
+                        "language": "ja",
+                        "is_final": is_final,
+                        "processing_time_ms": int((time.time() - start_time) * 1000)
+                    }
                 # Convert to float32 in range [-1.0, 1.0] as required by faster-whisper
-                audio_float = audio_array.astype(np.float32) / 32768.0
+                # (single fused pass, no intermediate float32 copy before scaling)
+                audio_float = np.multiply(audio_array, _PCM16_SCALE, dtype=np.float32)
             except Exception as e:
                 logger.error(f"Failed to decode audio data: {e}")
                 return {
@@ -667,40 +1175,34 @@ class WhisperSTTEngine:
             # Perform transcription with faster-whisper (STT-REQ-002.11)
             logger.debug(f"Transcribing audio: {len(audio_float)} samples at {sample_rate}Hz")
 
-            segments, info = self.model.transcribe(
-                audio_float,
-                language="ja",  # Japanese language hint
-                beam_size=5,
-                vad_filter=False,  # VAD handled separately in Task 4
-            )
-
-            # Extract text from segments
-            text_parts = []
-            total_logprob = 0.0
-            segment_count = 0
+            if self._max_batch_size > 1:
+                segments, detected_language = await self._submit_to_batch(audio_float, is_final)
+            else:
+                transcribe_kwargs = self._beam_kwargs if is_final else self._greedy_kwargs
+                segments, info = self.model.transcribe(audio_float, **transcribe_kwargs)
+                detected_language = info.language if hasattr(info, 'language') else "ja"
 
-            for segment in segments:
-                text_parts.append(segment.text)
-                total_logprob += segment.avg_logprob
-                segment_count += 1
+            # Materialize segments (faster-whisper returns a lazy generator)
+            segment_list = list(segments)
 
             # Combine text
-            full_text = "".join(text_parts).strip()
+            full_text = "".join(segment.text for segment in segment_list).strip()
 
             # Calculate confidence from average log probability
             # avg_logprob ranges from -infinity to 0 (0 is perfect)
             # Convert to confidence score [0, 1]
-            if segment_count > 0:
-                avg_logprob = total_logprob / segment_count
+            if segment_list:
+                avg_logprob = np.fromiter(
+                    (segment.avg_logprob for segment in segment_list),
+                    dtype=np.float64,
+                    count=len(segment_list)
+                ).mean()
                 # Use exponential to convert log probability to confidence
                 # Clamp to reasonable range
-                confidence = min(1.0, max(0.0, np.exp(avg_logprob)))
+                confidence = float(np.clip(np.exp(avg_logprob), 0.0, 1.0))
             else:
                 confidence = 0.0
 
-            # Detect language
-            detected_language = info.language if hasattr(info, 'language') else "ja"
-
             processing_time = int((time.time() - start_time) * 1000)
 
             logger.debug(f"Transcription complete: '{full_text}' (confidence={confidence:.2f}, time={processing_time}ms)")
@@ -4,30 +4,76 @@ Test script to verify ready message output format.
 This script simulates the ready message send logic without dependencies.
 """
 
+import os
 import sys
-import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+# Canonical ready message (matching main.py ready signal as passed to
+# IpcHandler.send_message; the host defaults a missing "version" to 1.0)
+READY_MESSAGE = {
+    'type': 'ready',
+    'message': 'Python sidecar ready (MVP1 Real STT)'
+}
+
+# Escapes for the only characters that can appear in our message texts and
+# need escaping in a JSON string (texts are fixed and contain no control chars)
+_JSON_ESCAPES = str.maketrans({'"': '\\"', '\\': '\\\\'})
+
+
+def encode_ready(msg_text: str) -> bytes:
+    """
+    Encode a ready message as compact JSON plus newline delimiter by
+    concatenation, without a general-purpose serializer (fixed schema).
+    """
+    return (
+        b'{"type":"ready","message":"'
+        + msg_text.translate(_JSON_ESCAPES).encode('utf-8')
+        + b'"}\n'
+    )
+
+
+# The message never changes, so serialize it once
+READY_BYTES = encode_ready(READY_MESSAGE['message'])
+
+# Debug echo to stderr is opt-in (STT_DEBUG=1) so normal runs only do the IPC write
+DEBUG = os.getenv("STT_DEBUG") == "1"
+
+if __debug__:
+    # Catch drift between the literal and the canonical message
+    _loads = orjson.loads if orjson is not None else json.loads
+    assert _loads(READY_BYTES) == READY_MESSAGE, "READY_BYTES out of sync with READY_MESSAGE"
+
+# Unbuffered binary view of fd 1 (sys.stdout itself is left alone for print()).
+# Each write is one syscall (atomic on a pipe for messages under PIPE_BUF), and
+# there is no Python-side buffer that a crash could leave unflushed.
+STDOUT_RAW = open(sys.stdout.fileno(), 'wb', buffering=0, closefd=False)
+
 
 def main():
-    # Simulate ready message (matching main.py L650-653)
-    message = {
-        'type': 'ready',
-        'version': '1.0',  # Added by IpcHandler if not present
-        'message': 'Python sidecar ready (MVP1 Real STT)'
-    }
-
-    # Serialize to JSON (matching IpcHandler.send_message L103)
-    json_str = json.dumps(message, separators=(',', ':'))
-
-    # Add newline delimiter (matching IpcHandler.send_message L112)
-    data = (json_str + '\n').encode('utf-8')
-
-    # Write to stdout (matching IpcHandler.send_message L115-116)
-    sys.stdout.buffer.write(data)
-    sys.stdout.buffer.flush()
-
-    # Write debug info to stderr
-    print(f"[DEBUG] Sent to stdout: {json_str}", file=sys.stderr)
-    print(f"[DEBUG] Length: {len(data)} bytes", file=sys.stderr)
+    data = READY_BYTES
+
+    # Single write() straight to the kernel; nothing left to flush
+    STDOUT_RAW.write(data)
+
+    # Write debug info to stderr: both lines in one vectored write, built from
+    # the already-serialized payload (no decode/format)
+    if DEBUG:
+        parts = [
+            b"[DEBUG] Sent to stdout: ", data,
+            b"[DEBUG] Length: ", str(len(data)).encode('ascii'), b" bytes\n",
+        ]
+        sys.stderr.flush()
+        if hasattr(os, 'writev'):
+            os.writev(sys.stderr.fileno(), parts)
+        else:
+            # Windows has no writev
+            sys.stderr.buffer.write(b"".join(parts))
+            sys.stderr.buffer.flush()
 
 if __name__ == '__main__':
     main()
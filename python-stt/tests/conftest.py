@@ -0,0 +1,35 @@
+"""
+Shared pytest configuration for python-stt tests.
+
+Async tests run on uvloop when it is installed (requirements-dev.txt; not
+available on Windows) and fall back to the default asyncio loop otherwise.
+"""
+
+import numpy as np
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on the dev environment
+    uvloop = None
+
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run every pytest-asyncio test on a uvloop event loop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+# 10ms frames at 16kHz (160 int16 samples = 320 bytes), built once per session.
+# Tests that use them mock webrtcvad, so the speech frame only needs the right
+# length; a deterministic sawtooth keeps runs reproducible.
+@pytest.fixture(scope="session")
+def speech_frame():
+    """One 10ms speech-like PCM frame (deterministic sawtooth)."""
+    return (np.arange(-80, 80, dtype=np.int16) * 400).tobytes()
+
+
+@pytest.fixture(scope="session")
+def silence_frame():
+    """One 10ms frame of silence (160 zero int16 samples)."""
+    return bytes(320)
@@ -49,7 +49,7 @@ class MockSTTEngine:
     """Mock STT that only transcribes audio"""
     async def transcribe(self, audio_data, sample_rate=16000, is_final=True):
         """Simulate STT transcription"""
-        await asyncio.sleep(0.01)  # Simulate processing time
+        await asyncio.sleep(0)  # Yield like real STT work, without a timer wait
 
         if is_final:
             return {
@@ -67,6 +67,18 @@ class MockSTTEngine:
             }
 
 
+class FailingSTTEngine:
+    """STT stub whose transcription always raises"""
+    def __init__(self, message="STT failed"):
+        self.message = message
+        self.calls = 0
+
+    async def transcribe(self, audio_data, sample_rate=16000, is_final=True):
+        """Count the call and fail"""
+        self.calls += 1
+        raise Exception(self.message)
+
+
 class TestAudioPipelineInitialization:
     """Test pipeline initialization"""
 
@@ -142,6 +154,18 @@ class TestVADSTTDecoupling:
         assert results[1]['event'] == 'final_text'
         assert results[1]['transcription']['text'] == 'Final transcription text'
 
+    @pytest.mark.asyncio
+    async def test_process_audio_frames_matches_per_frame_processing(self):
+        """WHEN a batch of frames is processed with process_audio_frames
+        THEN the same events are returned as with per-frame processing"""
+        pipeline = AudioPipeline(vad=MockVAD(), stt_engine=MockSTTEngine())
+
+        results = await pipeline.process_audio_frames([b'frame'] * 200)
+
+        assert [r['event'] for r in results] == ['speech_start', 'final_text']
+        assert results[1]['transcription']['text'] == 'Final transcription text'
+        assert await AudioPipeline().process_audio_frames([b'frame']) == []
+
 
 class TestPartialTranscription:
     """Test partial transcription generation"""
@@ -182,8 +206,7 @@ class TestErrorHandling:
         """WHEN STT fails
         THEN pipeline should handle error gracefully"""
         vad = MockVAD()
-        stt = AsyncMock()
-        stt.transcribe.side_effect = Exception("STT failed")
+        stt = FailingSTTEngine("STT failed")
 
         pipeline = AudioPipeline(vad=vad, stt_engine=stt)
 
@@ -196,6 +219,7 @@ class TestErrorHandling:
         assert result['event'] == 'error'
         assert 'STT failed' in result['error']
         assert pipeline.stats['errors'] == 1
+        assert stt.calls == 1
 
     @pytest.mark.asyncio
     async def test_continues_after_error(self):
@@ -249,6 +273,37 @@ class TestStatistics:
         stats2 = pipeline.get_stats()
         assert 'modified' not in stats2
 
+    def test_get_stats_view_is_live_and_read_only(self):
+        """WHEN get_stats_view is called
+        THEN should reflect later updates and reject mutation"""
+        pipeline = AudioPipeline()
+
+        view = pipeline.get_stats_view()
+        pipeline.stats['errors'] += 1
+
+        assert view['errors'] == 1
+        with pytest.raises(TypeError):
+            view['errors'] = 0
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_speech_state_but_keeps_stats(self):
+        """WHEN reset is called mid-speech
+        THEN speech state is cleared and statistics are kept"""
+        vad = MagicMock()
+        pipeline = AudioPipeline(vad=vad, stt_engine=MockSTTEngine())
+        await pipeline._handle_speech_start(pre_roll=b'\x00' * 640, timestamp_ms=1000)
+        pipeline._frame_count_since_partial = 5
+        pipeline.stats['segments_processed'] = 3
+
+        pipeline.reset()
+
+        assert pipeline.has_buffered_speech() is False
+        assert pipeline._speech_start_time is None
+        assert pipeline._speech_start_timestamp_ms is None
+        assert pipeline._frame_count_since_partial == 0
+        assert pipeline.get_stats()['segments_processed'] == 3
+        vad.reset.assert_called_once_with()
+
 
 class TestPartialTextPreRollIntegrity:
     """
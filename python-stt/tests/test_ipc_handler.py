@@ -12,6 +12,7 @@ Requirements:
 import pytest
 import asyncio
 import json
+import os
 import sys
 from io import StringIO, BytesIO
 from unittest.mock import MagicMock, patch, AsyncMock
@@ -111,6 +112,117 @@ class TestIpcMessageSending:
 
         assert "Message too large" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_send_message_writes_compact_utf8_line(self):
+        """WHEN sending a message with Japanese text
+        THEN should write a single compact, newline-terminated UTF-8 JSON line"""
+        handler = IpcHandler()
+
+        mock_stdout = MagicMock()
+        mock_buffer = BytesIO()
+        mock_stdout.buffer = mock_buffer
+
+        with patch('sys.stdout', mock_stdout):
+            await handler.send_message({"type": "transcription", "text": "こんにちは", "version": "1.0", "timestamp": 1})
+
+        written_data = mock_buffer.getvalue()
+        assert written_data.endswith(b'\n')
+        assert written_data.count(b'\n') == 1
+        assert b' ' not in written_data
+        assert json.loads(written_data)["text"] == "こんにちは"
+
+    @pytest.mark.asyncio
+    async def test_send_message_uses_single_os_write_on_pipe(self):
+        """WHEN stdout is a pipe
+        THEN each message should be written with one os.write() call"""
+        handler = IpcHandler()
+        read_fd, write_fd = os.pipe()
+
+        mock_stdout = MagicMock()
+        mock_stdout.fileno.return_value = write_fd
+
+        try:
+            with patch('sys.stdout', mock_stdout), \
+                    patch('stt_engine.ipc_handler.os.write', wraps=os.write) as mock_write:
+                await handler.send_message({"type": "test", "version": "1.0", "timestamp": 1})
+                await handler.send_message({"type": "test2", "version": "1.0", "timestamp": 2})
+
+            assert mock_write.call_count == 2
+            mock_stdout.buffer.write.assert_not_called()
+            lines = os.read(read_fd, 4096).splitlines()
+            assert [json.loads(line)["type"] for line in lines] == ["test", "test2"]
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    @pytest.mark.asyncio
+    async def test_partial_text_events_are_coalesced_on_pipe(self):
+        """WHEN partial_text events are followed by a final_text event on a pipe
+        THEN they should be written together, in order, with one os.write() call"""
+        handler = IpcHandler()
+        read_fd, write_fd = os.pipe()
+
+        mock_stdout = MagicMock()
+        mock_stdout.fileno.return_value = write_fd
+
+        def event(event_type):
+            return {"type": "event", "eventType": event_type, "data": {}, "version": "1.0", "timestamp": 1}
+
+        try:
+            with patch('sys.stdout', mock_stdout), \
+                    patch('stt_engine.ipc_handler.os.write', wraps=os.write) as mock_write:
+                await handler.send_message(event("partial_text"))
+                await handler.send_message(event("partial_text"))
+                assert mock_write.call_count == 0
+
+                await handler.send_message(event("final_text"))
+                assert mock_write.call_count == 1
+
+                await handler.send_message(event("partial_text"))
+                await asyncio.sleep(handler.COALESCE_DELAY_SEC * 4)
+                assert mock_write.call_count == 2
+
+            lines = os.read(read_fd, 4096).splitlines()
+            assert [json.loads(line)["eventType"] for line in lines] == \
+                ["partial_text", "partial_text", "final_text", "partial_text"]
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    @pytest.mark.asyncio
+    async def test_coalesced_events_flush_to_old_pipe_when_stdout_is_rebound(self):
+        """WHEN sys.stdout is rebound while partial_text events are queued
+        THEN the queued events should go to the pipe they were queued for
+        AND messages_sent should only count messages actually written"""
+        handler = IpcHandler()
+        read_fd, write_fd = os.pipe()
+
+        pipe_stdout = MagicMock()
+        pipe_stdout.fileno.return_value = write_fd
+        captured_stdout = MagicMock()
+        captured_stdout.fileno.side_effect = OSError
+        captured_stdout.buffer = BytesIO()
+
+        try:
+            with patch('sys.stdout', pipe_stdout):
+                await handler.send_message(
+                    {"type": "event", "eventType": "partial_text", "data": {}}
+                )
+            assert handler.stats["messages_sent"] == 0
+
+            with patch('sys.stdout', captured_stdout):
+                await handler.send_message({"type": "response", "id": "req-1"})
+                await asyncio.sleep(handler.COALESCE_DELAY_SEC * 4)
+
+            lines = os.read(read_fd, 4096).splitlines()
+            assert [json.loads(line)["eventType"] for line in lines] == ["partial_text"]
+            assert json.loads(captured_stdout.buffer.getvalue())["id"] == "req-1"
+            assert handler.stats["messages_sent"] == 2
+            assert handler.stats["errors"] == 0
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
     @pytest.mark.asyncio
     async def test_send_message_increments_stats(self):
         """WHEN sending a message successfully
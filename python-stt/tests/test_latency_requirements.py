@@ -14,7 +14,6 @@ Production E2E tests validate against actual targets.
 
 import pytest
 import time
-import numpy as np
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from stt_engine.audio_pipeline import AudioPipeline
 from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -211,7 +210,7 @@ class TestTimestampPropagation:
 class TestVADTimestampGeneration:
     """Test that VAD generates timestamps for events."""
 
-    def test_speech_start_includes_timestamp(self):
+    def test_speech_start_includes_timestamp(self, speech_frame):
         """WHEN VAD detects speech onset
         THEN speech_start event SHOULD include timestamp_ms field."""
         # Mock webrtcvad to ensure predictable behavior
@@ -224,9 +223,6 @@ class TestVADTimestampGeneration:
 
             vad = VoiceActivityDetector(sample_rate=16000, aggressiveness=3)
 
-            # Generate realistic audio frame (160 samples at 16kHz = 10ms)
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-
             # Feed 30 speech frames to trigger speech_start
             result = None
             for _ in range(30):
@@ -240,7 +236,7 @@ class TestVADTimestampGeneration:
             assert isinstance(result['timestamp_ms'], int)
             assert result['timestamp_ms'] > 0
 
-    def test_speech_end_includes_timestamp(self):
+    def test_speech_end_includes_timestamp(self, speech_frame, silence_frame):
         """WHEN VAD detects speech offset
         THEN speech_end event SHOULD include timestamp_ms field."""
         # Mock webrtcvad to ensure predictable behavior
@@ -250,10 +246,6 @@ class TestVADTimestampGeneration:
 
             vad = VoiceActivityDetector(sample_rate=16000, aggressiveness=3)
 
-            # Generate realistic audio frames
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-            silence_frame = np.zeros(160, dtype=np.int16).tobytes()
-
             # Step 1: Trigger speech_start (30 speech frames)
             mock_vad_instance.is_speech.return_value = True
             for _ in range(30):
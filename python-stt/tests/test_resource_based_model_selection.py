@@ -249,5 +249,47 @@ class TestAutoModelSelection:
             assert engine.model_size == "base"
 
 
+class TestBackendSelection:
+    """Test CTranslate2 device/compute_type selection from detected resources."""
+
+    def test_gpu_uses_cuda_int8_float16(self):
+        """WHEN a GPU is available
+        THEN the model should run on CUDA with int8_float16."""
+        engine = WhisperSTTEngine()
+
+        backend = engine._pick_backend({
+            'cpu_cores': 8, 'memory_gb': 16, 'has_gpu': True, 'gpu_memory_gb': 12
+        })
+
+        assert backend == ("cuda", "int8_float16", 0)
+
+    def test_cpu_uses_int8_with_all_cores(self):
+        """WHEN no GPU is available
+        THEN the model should run int8 on CPU with one thread per core."""
+        engine = WhisperSTTEngine()
+
+        backend = engine._pick_backend({
+            'cpu_cores': 6, 'memory_gb': 8, 'has_gpu': False, 'gpu_memory_gb': 0
+        })
+
+        assert backend == ("cpu", "int8", 6)
+
+    def test_gpu_load_failure_retries_on_cpu(self):
+        """WHEN loading on CUDA fails (e.g. CT2 built without CUDA)
+        THEN the model should be loaded on CPU instead."""
+        engine = WhisperSTTEngine()
+        engine._resources = {'cpu_cores': 4, 'memory_gb': 16, 'has_gpu': True, 'gpu_memory_gb': 12}
+
+        with patch('stt_engine.transcription.whisper_client.WhisperModel') as mock_whisper:
+            mock_whisper.side_effect = [RuntimeError("CUDA driver not found"), MagicMock()]
+
+            engine._load_whisper_model("/mock/small")
+
+        assert mock_whisper.call_count == 2
+        assert mock_whisper.call_args_list[0].kwargs["device"] == "cuda"
+        assert mock_whisper.call_args_list[1].kwargs["device"] == "cpu"
+        assert mock_whisper.call_args_list[1].kwargs["cpu_threads"] == 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
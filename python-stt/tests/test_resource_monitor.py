@@ -14,6 +14,17 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 
+def _configure_mem(mock_mem, percent=None, used_gb=None, available_gb=None):
+    """Set the fields of a patched psutil.virtual_memory() reading (sizes in GB)."""
+    mem = mock_mem.return_value
+    if percent is not None:
+        mem.percent = percent
+    if used_gb is not None:
+        mem.used = used_gb * (1024 ** 3)
+    if available_gb is not None:
+        mem.available = available_gb * (1024 ** 3)
+
+
 class TestResourceDetection:
     """Test resource detection on startup (STT-REQ-006.1)"""
 
@@ -667,10 +678,9 @@ class TestMonitoringLoop:
         with patch('psutil.cpu_percent', return_value=90), \
              patch('psutil.virtual_memory') as mock_mem:
 
-            # Set memory low enough to avoid memory-based downgrade (< 3GB)
-            mock_mem.return_value.percent = 30
-            mock_mem.return_value.used = 2.0 * (1024 ** 3)  # 2GB (< 3GB threshold)
-            mock_mem.return_value.available = 4 * (1024 ** 3)  # Phase 1.1: _update_state_machine needs available
+            # Set memory low enough to avoid memory-based downgrade (2GB < 3GB threshold);
+            # Phase 1.1: _update_state_machine needs available
+            _configure_mem(mock_mem, percent=30, used_gb=2.0, available_gb=4)
 
             on_downgrade = AsyncMock()
 
@@ -707,9 +717,7 @@ class TestMonitoringLoop:
         with patch('psutil.cpu_percent', return_value=30), \
              patch('psutil.virtual_memory') as mock_mem:
 
-            mock_mem.return_value.percent = 40
-            mock_mem.return_value.used = 1.5 * (1024 ** 3)  # 1.5GB (low memory)
-            mock_mem.return_value.available = 4 * (1024 ** 3)
+            _configure_mem(mock_mem, percent=40, used_gb=1.5, available_gb=4)  # 1.5GB (low memory)
 
             on_upgrade_proposal = AsyncMock()
 
@@ -750,18 +758,19 @@ class TestMonitoringLoop:
              patch('psutil.virtual_memory') as mock_mem, \
              patch('psutil.cpu_percent', return_value=50):
 
-            # System memory for logging/state machine
-            mock_mem.return_value.percent = 92
-            mock_mem.return_value.available = 3 * (1024 ** 3)  # System has plenty available
+            # System memory for logging/state machine (system has plenty available)
+            _configure_mem(mock_mem, percent=92, available_gb=3)
 
-            on_downgrade = AsyncMock()
+            triggered = asyncio.Event()
+            on_downgrade = AsyncMock(side_effect=lambda *args: triggered.set())
 
             task = asyncio.create_task(monitor.start_monitoring(
                 interval_seconds=0.1,
                 on_downgrade=on_downgrade
             ))
 
-            await asyncio.sleep(0.25)
+            # Wait for the callback instead of a fixed sleep
+            await asyncio.wait_for(triggered.wait(), timeout=1.0)
             await monitor.stop_monitoring()
             await task
 
@@ -791,8 +800,7 @@ class TestMonitoringLoop:
         with patch('psutil.virtual_memory') as mock_mem, \
              patch('psutil.cpu_percent', return_value=55):
 
-            mock_mem.return_value.percent = 90
-            mock_mem.return_value.used = 4.5 * (1024 ** 3)
+            _configure_mem(mock_mem, percent=90, used_gb=4.5)
 
             on_downgrade = AsyncMock()
 
@@ -826,7 +834,8 @@ class TestMonitoringLoop:
 
         # Mock CPU to always return high usage
         with patch('psutil.cpu_percent', return_value=90):
-            on_downgrade = AsyncMock()
+            triggered = asyncio.Event()
+            on_downgrade = AsyncMock(side_effect=lambda *args: triggered.set())
 
             # Simulate 60 seconds elapsed by manipulating cpu_high_start_time
             import time
@@ -837,7 +846,8 @@ class TestMonitoringLoop:
                 on_downgrade=on_downgrade
             ))
 
-            await asyncio.sleep(0.25)
+            # Wait for the callback instead of a fixed sleep
+            await asyncio.wait_for(triggered.wait(), timeout=1.0)
             await monitor.stop_monitoring()
             await task
 
@@ -869,12 +879,14 @@ class TestMonitoringLoop:
              patch('psutil.cpu_percent', return_value=50), \
              patch('psutil.virtual_memory') as mock_mem:
 
-            # System memory for logging/state machine
-            mock_mem.return_value.percent = 92
-            mock_mem.return_value.available = 3 * (1024 ** 3)  # System has plenty available
+            # System memory for logging/state machine (system has plenty available)
+            _configure_mem(mock_mem, percent=92, available_gb=3)
 
             # Mock callback that fails
+            triggered = asyncio.Event()
+
             async def failing_downgrade(old_model, new_model):
+                triggered.set()
                 raise RuntimeError("Mock downgrade failure")
 
             on_downgrade = AsyncMock(side_effect=failing_downgrade)
@@ -884,7 +896,8 @@ class TestMonitoringLoop:
                 on_downgrade=on_downgrade
             ))
 
-            await asyncio.sleep(0.25)
+            # Wait for the callback instead of a fixed sleep
+            await asyncio.wait_for(triggered.wait(), timeout=1.0)
             await monitor.stop_monitoring()
             await task
 
@@ -1007,8 +1020,7 @@ class TestStateMachineTransitions:
                  patch('psutil.virtual_memory') as mock_mem:
 
                 mock_cpu.return_value = 87.0  # CPU high
-                mock_mem.return_value = MagicMock()
-                mock_mem.return_value.available = 3 * (1024 ** 3)  # Memory OK
+                _configure_mem(mock_mem, available_gb=3)  # Memory OK
 
                 # Mock downgrade callback
                 downgrade_called = asyncio.Event()
@@ -1136,8 +1148,7 @@ class TestStateMachineTransitions:
                  patch('psutil.virtual_memory') as mock_mem:
 
                 mock_cpu.return_value = 40.0  # CPU OK
-                mock_mem.return_value = MagicMock()
-                mock_mem.return_value.available = 0.5 * (1024 ** 3)  # Memory critical (< 1.5GB)
+                _configure_mem(mock_mem, available_gb=0.5)  # Memory critical (< 1.5GB)
 
                 # Mock downgrade callback
                 async def mock_downgrade(old_model, new_model):
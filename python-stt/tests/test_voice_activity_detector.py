@@ -132,7 +132,7 @@ class TestFrameSplitting:
 class TestVADIntegration:
     """Test webrtcvad integration."""
 
-    def test_vad_is_speech_returns_boolean(self):
+    def test_vad_is_speech_returns_boolean(self, speech_frame):
         """WHEN checking if frame contains speech
         THEN should return boolean value."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -147,7 +147,7 @@ class TestVADIntegration:
             detector = VoiceActivityDetector()
 
             # Create a 10ms frame (160 samples = 320 bytes)
-            frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
+            frame = speech_frame
 
             result = detector.is_speech(frame)
 
@@ -157,7 +157,7 @@ class TestVADIntegration:
             # Verify is_speech was called with correct parameters
             mock_vad_instance.is_speech.assert_called_once_with(frame, 16000)
 
-    def test_vad_is_speech_with_silence_frame(self):
+    def test_vad_is_speech_with_silence_frame(self, silence_frame):
         """WHEN checking a silent frame
         THEN should return False."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -172,7 +172,7 @@ class TestVADIntegration:
             detector = VoiceActivityDetector()
 
             # Create a silent frame (all zeros)
-            frame = np.zeros(160, dtype=np.int16).tobytes()
+            frame = silence_frame
 
             result = detector.is_speech(frame)
 
@@ -182,7 +182,7 @@ class TestVADIntegration:
 class TestSpeechOnsetDetection:
     """Test speech onset detection (STT-REQ-003.4)."""
 
-    def test_detect_speech_onset_after_300ms(self):
+    def test_detect_speech_onset_after_300ms(self, speech_frame):
         """WHEN speech frames are detected for 0.3 seconds (30 frames)
         THEN should trigger speech onset event."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -197,7 +197,7 @@ class TestSpeechOnsetDetection:
             detector = VoiceActivityDetector()
 
             # Process 30 speech frames (0.3 seconds)
-            frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
+            frame = speech_frame
 
             speech_started = False
             for i in range(30):
@@ -208,7 +208,7 @@ class TestSpeechOnsetDetection:
 
             assert speech_started is True
 
-    def test_no_speech_onset_before_300ms(self):
+    def test_no_speech_onset_before_300ms(self, speech_frame):
         """WHEN speech frames are detected for less than 0.3 seconds
         THEN should NOT trigger speech onset event."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -222,7 +222,7 @@ class TestSpeechOnsetDetection:
             detector = VoiceActivityDetector()
 
             # Process only 29 speech frames (less than 0.3 seconds)
-            frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
+            frame = speech_frame
 
             speech_started = False
             for i in range(29):
@@ -233,7 +233,7 @@ class TestSpeechOnsetDetection:
 
             assert speech_started is False
 
-    def test_speech_onset_reset_on_silence(self):
+    def test_speech_onset_reset_on_silence(self, speech_frame, silence_frame):
         """WHEN speech is interrupted by silence before 0.3 seconds
         THEN should reset speech onset counter."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -244,9 +244,6 @@ class TestSpeechOnsetDetection:
 
             detector = VoiceActivityDetector()
 
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-            silence_frame = np.zeros(160, dtype=np.int16).tobytes()
-
             # Process 20 speech frames
             mock_vad_instance.is_speech.return_value = True
             for i in range(20):
@@ -272,7 +269,7 @@ class TestSpeechOnsetDetection:
 class TestSpeechOffsetDetection:
     """Test speech offset detection (STT-REQ-003.5)."""
 
-    def test_detect_speech_offset_after_500ms_silence(self):
+    def test_detect_speech_offset_after_500ms_silence(self, speech_frame, silence_frame):
         """WHEN silence frames are detected for 0.5 seconds (50 frames) after speech
         THEN should trigger speech offset event and finalize segment."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -283,9 +280,6 @@ class TestSpeechOffsetDetection:
 
             detector = VoiceActivityDetector()
 
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-            silence_frame = np.zeros(160, dtype=np.int16).tobytes()
-
             # First, trigger speech onset (30 speech frames)
             mock_vad_instance.is_speech.return_value = True
             for i in range(30):
@@ -303,7 +297,7 @@ class TestSpeechOffsetDetection:
 
             assert speech_ended is True
 
-    def test_no_speech_offset_before_500ms_silence(self):
+    def test_no_speech_offset_before_500ms_silence(self, speech_frame, silence_frame):
         """WHEN silence frames are detected for less than 0.5 seconds
         THEN should NOT trigger speech offset event."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -314,9 +308,6 @@ class TestSpeechOffsetDetection:
 
             detector = VoiceActivityDetector()
 
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-            silence_frame = np.zeros(160, dtype=np.int16).tobytes()
-
             # Trigger speech onset
             mock_vad_instance.is_speech.return_value = True
             for i in range(30):
@@ -333,7 +324,7 @@ class TestSpeechOffsetDetection:
 
             assert speech_ended is False
 
-    def test_speech_offset_reset_on_new_speech(self):
+    def test_speech_offset_reset_on_new_speech(self, speech_frame, silence_frame):
         """WHEN silence is interrupted by new speech before 0.5 seconds
         THEN should reset silence counter and continue speech."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -344,9 +335,6 @@ class TestSpeechOffsetDetection:
 
             detector = VoiceActivityDetector()
 
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-            silence_frame = np.zeros(160, dtype=np.int16).tobytes()
-
             # Trigger speech onset
             mock_vad_instance.is_speech.return_value = True
             for i in range(30):
@@ -374,11 +362,37 @@ class TestSpeechOffsetDetection:
             # Should NOT trigger because counter was reset
             assert speech_ended is False
 
+    def test_reset_returns_to_initial_state(self):
+        """WHEN reset() is called during speech
+        THEN the detector drops the segment and needs a fresh 0.3s onset."""
+        from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
+
+        with patch('stt_engine.transcription.voice_activity_detector.webrtcvad.Vad') as mock_vad_class:
+            mock_vad_instance = MagicMock()
+            mock_vad_class.return_value = mock_vad_instance
+
+            detector = VoiceActivityDetector()
+            frame = bytes(320)
+
+            mock_vad_instance.is_speech.return_value = True
+            for i in range(40):
+                detector.process_frame(frame)
+            assert detector.is_in_speech is True
+
+            detector.reset()
+
+            assert detector.is_in_speech is False
+            assert detector.current_segment == []
+            assert len(detector.pre_roll_buffer) == 0
+            results = [detector.process_frame(frame) for _ in range(29)]
+            assert all(r is None for r in results)
+            assert detector.process_frame(frame)['event'] == 'speech_start'
+
 
 class TestSegmentFinalization:
     """Test speech segment finalization (STT-REQ-003.5)."""
 
-    def test_segment_contains_audio_data(self):
+    def test_segment_contains_audio_data(self, speech_frame, silence_frame):
         """WHEN speech segment is finalized
         THEN should contain accumulated audio data."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -389,9 +403,6 @@ class TestSegmentFinalization:
 
             detector = VoiceActivityDetector()
 
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-            silence_frame = np.zeros(160, dtype=np.int16).tobytes()
-
             # Trigger speech onset and accumulate frames
             mock_vad_instance.is_speech.return_value = True
             for i in range(50):  # 0.5 seconds of speech
@@ -411,7 +422,7 @@ class TestSegmentFinalization:
             assert 'audio_data' in result['segment']
             assert len(result['segment']['audio_data']) > 0
 
-    def test_segment_contains_duration(self):
+    def test_segment_contains_duration(self, speech_frame, silence_frame):
         """WHEN speech segment is finalized
         THEN should contain duration information."""
         from stt_engine.transcription.voice_activity_detector import VoiceActivityDetector
@@ -422,9 +433,6 @@ class TestSegmentFinalization:
 
             detector = VoiceActivityDetector()
 
-            speech_frame = np.random.randint(-32768, 32767, 160, dtype=np.int16).tobytes()
-            silence_frame = np.zeros(160, dtype=np.int16).tobytes()
-
             # Trigger speech onset
             mock_vad_instance.is_speech.return_value = True
             for i in range(50):
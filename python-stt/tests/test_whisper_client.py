@@ -39,36 +39,92 @@ class TestWhisperSTTEngineInitialization:
             user_model_path = Path(tmpdir) / "custom_model"
             user_model_path.mkdir()
 
+            config_file = Path(tmpdir) / ".config" / "meeting-minutes-automator" / "whisper_model_path"
+            config_file.parent.mkdir(parents=True)
+            config_file.write_text(f"{user_model_path}\n")
+
+            engine = WhisperSTTEngine()
+
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                detected_path = engine._detect_model_path()
+
+                assert detected_path == str(user_model_path)
+
+    def test_user_config_is_reread_only_when_changed(self):
+        """WHEN _detect_model_path() runs repeatedly
+        THEN the user config file is read once until its mtime/size changes."""
+        import os
+        import builtins
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first_model = Path(tmpdir) / "first_model"
+            first_model.mkdir()
+            second_model = Path(tmpdir) / "second_model_dir"
+            second_model.mkdir()
+
+            config_file = Path(tmpdir) / ".config" / "meeting-minutes-automator" / "whisper_model_path"
+            config_file.parent.mkdir(parents=True)
+            config_file.write_text(str(first_model))
+
             engine = WhisperSTTEngine()
 
-            with patch('pathlib.Path.exists', return_value=True):
-                with patch('pathlib.Path.expanduser', return_value=Path(tmpdir) / ".config" / "meeting-minutes-automator" / "whisper_model_path"):
-                    with patch('builtins.open', create=True) as mock_open:
-                        mock_open.return_value.__enter__.return_value.read.return_value = str(user_model_path)
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                with patch('builtins.open', wraps=builtins.open) as mock_open:
+                    assert engine._detect_model_path() == str(first_model)
+                    assert engine._detect_model_path() == str(first_model)
+                    assert mock_open.call_count == 1
 
-                        detected_path = engine._detect_model_path()
+                    config_file.write_text(str(second_model))
+                    os.utime(config_file, ns=(0, 1_000_000_000))
 
-                        assert detected_path == str(user_model_path)
+                    assert engine._detect_model_path() == str(second_model)
+                    assert mock_open.call_count == 2
 
     @pytest.mark.asyncio
     async def test_model_detection_priority_huggingface_cache(self):
         """WHEN user config doesn't exist but HuggingFace cache exists
         THEN WhisperSTTEngine should use HF cache (STT-REQ-002.1 priority 2)."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            # Create actual directory structure including snapshots
-            hf_cache_path = Path(tmpdir) / ".cache" / "huggingface" / "hub" / "models--Systran--faster-whisper-small"
-            snapshots_dir = hf_cache_path / "snapshots"
-            snapshots_dir.mkdir(parents=True)
-            # Create a dummy snapshot directory (iterdir() needs at least one entry)
-            (snapshots_dir / "abc123def456").mkdir()
+            # Create actual HF cache layout: refs/main → snapshots/<hash>/model.bin
+            hf_cache_root = Path(tmpdir) / ".cache" / "huggingface" / "hub"
+            hf_cache_path = hf_cache_root / "models--Systran--faster-whisper-small"
+            snapshot_dir = hf_cache_path / "snapshots" / "abc123def456"
+            snapshot_dir.mkdir(parents=True)
+            (snapshot_dir / "model.bin").touch()
+            (hf_cache_path / "refs").mkdir()
+            (hf_cache_path / "refs" / "main").write_text("abc123def456")
 
             engine = WhisperSTTEngine(model_size="small")
 
             with patch.object(Path, 'home', return_value=Path(tmpdir)):
-                detected_path = engine._detect_model_path()
+                with patch('huggingface_hub.constants.HF_HUB_CACHE', str(hf_cache_root)):
+                    detected_path = engine._detect_model_path()
 
                 assert "huggingface" in detected_path
                 assert "faster-whisper-small" in detected_path
+                assert detected_path == str(snapshot_dir)
+
+    @pytest.mark.asyncio
+    async def test_model_detection_huggingface_cache_follows_refs_main(self):
+        """WHEN the HF cache holds several snapshots
+        THEN the snapshot pinned by refs/main is used, not an arbitrary one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hf_cache_root = Path(tmpdir) / "hub"
+            hf_cache_path = hf_cache_root / "models--Systran--faster-whisper-small"
+            for revision in ("0000old", "ffffnew"):
+                snapshot_dir = hf_cache_path / "snapshots" / revision
+                snapshot_dir.mkdir(parents=True)
+                (snapshot_dir / "model.bin").touch()
+            (hf_cache_path / "refs").mkdir()
+            (hf_cache_path / "refs" / "main").write_text("ffffnew")
+
+            engine = WhisperSTTEngine(model_size="small", offline_mode=True)
+
+            with patch.object(Path, 'home', return_value=Path(tmpdir)):
+                with patch('huggingface_hub.constants.HF_HUB_CACHE', str(hf_cache_root)):
+                    detected_path = engine._detect_model_path()
+
+            assert detected_path == str(hf_cache_path / "snapshots" / "ffffnew")
 
     @pytest.mark.asyncio
     async def test_model_detection_priority_bundled_fallback(self):
@@ -101,7 +157,7 @@ class TestWhisperSTTEngineInitialization:
             with patch('stt_engine.transcription.whisper_client.WhisperModel') as mock_whisper:
                 mock_whisper.return_value = MagicMock()
 
-                with patch('sys.stdout.write') as mock_stdout:
+                with patch('stt_engine.transcription.whisper_client._write_stdout_line') as mock_stdout:
                     await engine.initialize()
 
                     # Check that stdout was written with ready message
@@ -110,6 +166,26 @@ class TestWhisperSTTEngineInitialization:
 
                     assert ready_message_found, "Expected 'whisper_model_ready' message in stdout"
 
+    def test_ready_message_written_to_stdout_fd(self):
+        """WHEN a ready message is written
+        THEN the exact bytes reach file descriptor 1's pipe, newline-terminated."""
+        import os
+        from stt_engine.transcription.whisper_client import _write_stdout_line
+
+        read_fd, write_fd = os.pipe()
+        try:
+            fake_stdout = MagicMock()
+            fake_stdout.fileno.return_value = write_fd
+
+            with patch('sys.stdout', fake_stdout):
+                _write_stdout_line(b'{"type":"event","event":"whisper_model_ready"}\n')
+
+            assert os.read(read_fd, 4096) == b'{"type":"event","event":"whisper_model_ready"}\n'
+            fake_stdout.write.assert_not_called()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
     @pytest.mark.asyncio
     async def test_initialize_loads_faster_whisper_model(self):
         """WHEN WhisperSTTEngine.initialize() is called
@@ -126,6 +202,31 @@ class TestWhisperSTTEngineInitialization:
                 assert engine.model is not None
                 mock_whisper.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_initialize_local_path_skips_hub_request(self):
+        """WHEN the detected model path is a local directory
+        THEN WhisperModel is loaded with local_files_only=True (no Hub HEAD request)."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            engine = WhisperSTTEngine(model_size="tiny")
+
+            with patch.object(engine, '_detect_model_path', return_value=tmpdir):
+                with patch('stt_engine.transcription.whisper_client.WhisperModel') as mock_whisper:
+                    await engine.initialize()
+
+            assert mock_whisper.call_args.kwargs["local_files_only"] is True
+
+    @pytest.mark.asyncio
+    async def test_initialize_hub_model_id_allows_download(self):
+        """WHEN the detected model path is a Hub model ID in online mode
+        THEN WhisperModel is allowed to reach the Hub (local_files_only=False)."""
+        engine = WhisperSTTEngine(model_size="tiny")
+
+        with patch.object(engine, '_detect_model_path', return_value="Systran/faster-whisper-tiny"):
+            with patch('stt_engine.transcription.whisper_client.WhisperModel') as mock_whisper:
+                await engine.initialize()
+
+        assert mock_whisper.call_args.kwargs["local_files_only"] is False
+
 
 class TestWhisperSTTEngineModelTypes:
     """Test WhisperSTTEngine model size validation."""
@@ -182,7 +283,9 @@ class TestWhisperSTTEngineModelSwitching:
         old_model_path = engine.model_path
 
         # Mock WhisperModel to raise exception on construction
-        with patch('stt_engine.transcription.whisper_client.WhisperModel') as mock_whisper_model:
+        # (and keep model detection off the network)
+        with patch('stt_engine.transcription.whisper_client.WhisperModel') as mock_whisper_model, \
+                patch.object(engine, '_try_download_from_hub', return_value=None):
             mock_whisper_model.side_effect = RuntimeError("Mock model load failure")
 
             # Try to switch to 'base' model (should fail and rollback)
@@ -199,6 +302,65 @@ class TestWhisperSTTEngineModelSwitching:
             #  just verify model is not None)
             assert engine.model is not None, "Model should not be None after rollback"
 
+    @pytest.mark.asyncio
+    async def test_load_model_releases_old_model_in_background(self):
+        """
+        Task 5.2: the previous model is torn down off the caller's path
+
+        GIVEN WhisperSTTEngine with a loaded model
+        WHEN load_model() succeeds
+        THEN the new model is active immediately and the old one is freed
+        """
+        import weakref
+
+        class _FakeModel:
+            pass
+
+        engine = WhisperSTTEngine(model_size='tiny')
+        engine.model = _FakeModel()
+        old_ref = weakref.ref(engine.model)
+
+        with patch.object(engine, '_detect_model_path', return_value="/mock/base"):
+            with patch('stt_engine.transcription.whisper_client.WhisperModel') as mock_whisper_model:
+                await engine.load_model('base')
+
+        assert engine.model is mock_whisper_model.return_value
+
+        # Wait for the teardown thread to finish, then the old model must be gone
+        assert engine._teardown_slot.acquire(timeout=5.0)
+        engine._teardown_slot.release()
+        assert old_ref() is None, "Old model should be released after teardown"
+
+    @pytest.mark.asyncio
+    async def test_load_model_frees_old_model_off_the_main_thread(self):
+        """
+        Task 5.2: the teardown thread holds the last reference to the old model
+
+        GIVEN WhisperSTTEngine with a loaded model
+        WHEN load_model() succeeds
+        THEN the old model is finalized on the teardown thread, not the caller's
+        """
+        import threading
+
+        freed_on = []
+
+        class _FakeModel:
+            def __del__(self):
+                freed_on.append(threading.current_thread())
+
+        engine = WhisperSTTEngine(model_size='tiny')
+        engine.model = _FakeModel()
+
+        with patch.object(engine, '_detect_model_path', return_value="/mock/base"):
+            with patch('stt_engine.transcription.whisper_client.WhisperModel'):
+                await engine.load_model('base')
+
+        assert engine._teardown_slot.acquire(timeout=5.0)
+        engine._teardown_slot.release()
+        assert len(freed_on) == 1, "Old model should be finalized exactly once"
+        assert freed_on[0] is not threading.main_thread(), \
+            "Old model should not be freed on the caller's (main) thread"
+
 
 class TestBundledModelFallback:
     """Test bundled model fallback (STT-REQ-002.4/002.6)"""
@@ -307,6 +469,38 @@ class TestBundledModelFallback:
             assert engine.model_size == "small", "Should keep requested model"
             assert "small" in model_path, "Path should contain 'small'"
 
+    def test_bundled_scan_is_single_pass_and_memoized(self):
+        """
+        Verify bundled directories are scanned once and reused across lookups
+
+        GIVEN bundled 'base' only (plus a 'small' dir without model.bin)
+        WHEN _detect_bundled_model_path is called twice
+        THEN fallback to 'base' works and os.scandir runs once per base dir
+        """
+        import os
+        import tempfile
+        from pathlib import Path
+        from stt_engine.transcription.whisper_client import WhisperSTTEngine
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir) / "models" / "faster-whisper"
+            (base_dir / "base").mkdir(parents=True)
+            (base_dir / "base" / "model.bin").touch()
+            (base_dir / "small").mkdir()  # incomplete download: no model.bin
+
+            engine = WhisperSTTEngine(model_size='small', offline_mode=True)
+            missing_dir = Path(tmpdir) / "missing"
+
+            with patch.object(engine, '_bundled_base_dirs', return_value=[missing_dir, base_dir]):
+                with patch('os.scandir', wraps=os.scandir) as mock_scandir:
+                    first = engine._detect_bundled_model_path('small')
+                    second = engine._detect_bundled_model_path('base')
+
+            assert first == str(base_dir / "base")
+            assert second == str(base_dir / "base")
+            assert engine.model_size == "base"
+            assert mock_scandir.call_count == 2, "Each base dir should be scanned exactly once"
+
     @pytest.mark.asyncio
     async def test_load_model_returns_actual_model_on_fallback(self):
         """
@@ -459,5 +653,38 @@ class TestOnlineModeHubPriority:
             assert "base" in model_path, "Path should contain 'base'"
 
 
+class TestStructuredLogging:
+    """Test structured log events emitted by whisper_client."""
+
+    def test_structured_event_is_json(self, caplog):
+        """WHEN a structured warning event is logged
+        THEN the record message is a JSON payload with component/event/details."""
+        import logging
+        from stt_engine.transcription.whisper_client import log_warning_event
+
+        with caplog.at_level(logging.WARNING, logger="stt_engine.transcription.whisper_client"):
+            log_warning_event("resource_monitor", "memory_fallback", default_memory_gb=1.0)
+
+        payload = json.loads(caplog.records[-1].getMessage())
+        assert payload == {
+            "component": "resource_monitor",
+            "event": "memory_fallback",
+            "details": {"default_memory_gb": 1.0},
+        }
+
+    def test_disabled_level_skips_serialization(self):
+        """WHEN the event level is disabled
+        THEN the payload is never serialized."""
+        import logging
+        from stt_engine.transcription import whisper_client
+
+        client_logger = logging.getLogger("stt_engine.transcription.whisper_client")
+        with patch.object(client_logger, 'isEnabledFor', return_value=False):
+            with patch.object(whisper_client, '_dumps') as mock_dumps:
+                whisper_client.log_info_event("resource_monitor", "cpu_count_fallback")
+
+        mock_dumps.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,7 +4,9 @@ Unit tests for faster-whisper Inference (STT-REQ-002.11-002.14).
 Test-Driven Development: These tests are written first and will initially fail.
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 import base64
 import json
 import numpy as np
@@ -47,6 +49,59 @@ class TestAudioDataDecoding:
                 assert result is not None
                 assert "text" in result
 
+    @pytest.mark.asyncio
+    async def test_decode_memoryview_pcm_to_float32(self):
+        """WHEN PCM16 arrives as a memoryview (e.g. from a ring buffer)
+        THEN it is decoded as little-endian int16 scaled to float32 [-1.0, 1.0]."""
+        engine = WhisperSTTEngine(model_size="tiny")
+        engine.model = MagicMock()
+        engine.model.transcribe.return_value = ([], {"language": "ja"})
+
+        samples = np.array([0, 16384, -32768, 32767] * 4000, dtype='<i2')
+        await engine.transcribe(memoryview(bytearray(samples.tobytes())), is_final=True)
+
+        audio_float = engine.model.transcribe.call_args.args[0]
+        assert audio_float.dtype == np.float32
+        np.testing.assert_allclose(audio_float[:4], [0.0, 0.5, -1.0, 32767 / 32768], rtol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_near_silent_audio_skips_whisper(self):
+        """WHEN a chunk's RMS is below the silence threshold
+        THEN an empty result is returned without invoking the model."""
+        engine = WhisperSTTEngine(model_size="tiny")
+        engine.model = MagicMock()
+
+        quiet = np.random.randint(-50, 50, 16000, dtype=np.int16).tobytes()
+        result = await engine.transcribe(quiet, is_final=True)
+
+        assert result["text"] == ""
+        assert "error" not in result
+        engine.model.transcribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_silence_threshold_zero_disables_gate(self):
+        """WHEN silence_threshold=0
+        THEN even all-zero audio is passed to the model."""
+        engine = WhisperSTTEngine(model_size="tiny", silence_threshold=0)
+        engine.model = MagicMock()
+        engine.model.transcribe.return_value = ([], {"language": "ja"})
+
+        await engine.transcribe(bytes(32000), is_final=True)
+
+        engine.model.transcribe.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_odd_length_pcm_is_invalid_audio(self):
+        """WHEN the PCM16 buffer has an odd number of bytes
+        THEN INVALID_AUDIO is returned instead of silently truncating."""
+        engine = WhisperSTTEngine(model_size="tiny")
+        engine.model = MagicMock()
+
+        result = await engine.transcribe(b"\x00\x01\x02", is_final=True)
+
+        assert result["error"] == "INVALID_AUDIO"
+        engine.model.transcribe.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_handle_empty_audio_data(self):
         """WHEN empty audio data is provided
@@ -128,6 +183,60 @@ class TestWhisperInference:
                 assert isinstance(result["confidence"], (int, float))
                 assert 0 <= result["confidence"] <= 1
 
+    @pytest.mark.asyncio
+    async def test_transcribe_uses_configured_decoding_options(self):
+        """WHEN beam_size is changed on the engine
+        THEN subsequent transcribe() calls forward it with the Japanese hint."""
+        engine = WhisperSTTEngine(model_size="tiny")
+        engine.model = MagicMock()
+        engine.model.transcribe.return_value = ([], {"language": "ja"})
+        engine.beam_size = 3
+
+        audio_bytes = np.random.randint(-32768, 32767, 16000, dtype=np.int16).tobytes()
+        await engine.transcribe(audio_bytes, is_final=True)
+
+        kwargs = engine.model.transcribe.call_args.kwargs
+        assert kwargs == {"language": "ja", "beam_size": 3, "vad_filter": False}
+
+        with pytest.raises(ValueError):
+            engine.beam_size = 0
+
+    @pytest.mark.asyncio
+    async def test_partial_transcription_uses_greedy_decoding(self):
+        """WHEN is_final=False
+        THEN decoding is greedy (beam_size=1, single temperature) while finals keep beam search."""
+        engine = WhisperSTTEngine(model_size="tiny")
+        engine.model = MagicMock()
+        engine.model.transcribe.return_value = ([], {"language": "ja"})
+
+        audio_bytes = np.random.randint(-32768, 32767, 16000, dtype=np.int16).tobytes()
+        await engine.transcribe(audio_bytes, is_final=False)
+        partial_kwargs = engine.model.transcribe.call_args.kwargs
+        await engine.transcribe(audio_bytes, is_final=True)
+        final_kwargs = engine.model.transcribe.call_args.kwargs
+
+        assert partial_kwargs["beam_size"] == 1
+        assert partial_kwargs["best_of"] == 1
+        assert partial_kwargs["temperature"] == [0.0]
+        assert final_kwargs["beam_size"] == 5
+
+    @pytest.mark.asyncio
+    async def test_confidence_averages_all_segments(self):
+        """WHEN transcription yields several segments
+        THEN text is joined and confidence is exp(mean(avg_logprob)) as a plain float."""
+        engine = WhisperSTTEngine(model_size="tiny")
+        engine.model = MagicMock()
+
+        segments = (MagicMock(text=text, avg_logprob=logprob) for text, logprob in [("前半", -0.2), ("後半", -0.4)])
+        engine.model.transcribe.return_value = (segments, {"language": "ja"})
+
+        audio_bytes = np.random.randint(-32768, 32767, 16000, dtype=np.int16).tobytes()
+        result = await engine.transcribe(audio_bytes, sample_rate=16000, is_final=True)
+
+        assert result["text"] == "前半後半"
+        assert type(result["confidence"]) is float
+        assert result["confidence"] == round(float(np.exp(-0.3)), 3)
+
     @pytest.mark.asyncio
     async def test_error_when_model_not_initialized(self):
         """WHEN transcribe is called before initialization
@@ -286,5 +395,103 @@ class TestInvalidAudioHandling:
                 assert result is not None
 
 
+@pytest_asyncio.fixture
+async def batching_engine():
+    """
+    Factory for engines with micro-batching enabled and a mocked model.
+
+    Every engine is closed at teardown so no batch worker task outlives its
+    test on the shared (session-scoped) event loop.
+    """
+    engines = []
+
+    def make(**batch_options):
+        engine = WhisperSTTEngine(model_size="tiny", **batch_options)
+        engine.model = MagicMock()
+        engines.append(engine)
+        return engine
+
+    yield make
+
+    for engine in engines:
+        await engine.close()
+
+
+class TestMicroBatching:
+    """Test coalescing of concurrent transcribe() calls into one batched call."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batched_call(self, batching_engine):
+        """WHEN two transcriptions are requested concurrently with batching enabled
+        THEN a single batched pipeline call serves both, each getting its own text."""
+        engine = batching_engine(max_batch_size=4, batch_window_ms=20)
+
+        first = np.random.randint(-32768, 32767, 16000, dtype=np.int16).tobytes()   # 0.0s - 1.0s
+        second = np.random.randint(-32768, 32767, 8000, dtype=np.int16).tobytes()   # 1.0s - 1.5s
+
+        seg_first = MagicMock(text="最初", avg_logprob=-0.1, start=0.0, end=1.0)
+        seg_second = MagicMock(text="二番目", avg_logprob=-0.2, start=1.0, end=1.5)
+
+        with patch('stt_engine.transcription.whisper_client.BatchedInferencePipeline') as mock_pipeline_cls:
+            mock_pipeline = mock_pipeline_cls.return_value
+            mock_pipeline.model = engine.model
+            mock_pipeline.transcribe.return_value = ([seg_first, seg_second], MagicMock(language="ja"))
+
+            result_first, result_second = await asyncio.gather(
+                engine.transcribe(first, is_final=True),
+                engine.transcribe(second, is_final=True),
+            )
+
+        mock_pipeline.transcribe.assert_called_once()
+        kwargs = mock_pipeline.transcribe.call_args.kwargs
+        assert kwargs["batch_size"] == 2
+        assert kwargs["clip_timestamps"] == [
+            {"start": 0.0, "end": 1.0},
+            {"start": 1.0, "end": 1.5},
+        ]
+        assert result_first["text"] == "最初"
+        assert result_second["text"] == "二番目"
+        engine.model.transcribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_single_call_uses_regular_transcribe(self, batching_engine):
+        """WHEN only one request arrives within the batch window
+        THEN the regular (unbatched) model.transcribe path is used."""
+        engine = batching_engine(max_batch_size=4, batch_window_ms=1)
+
+        mock_segment = MagicMock(text="単独", avg_logprob=-0.3)
+        engine.model.transcribe.return_value = ([mock_segment], {"language": "ja"})
+
+        audio_bytes = np.random.randint(-32768, 32767, 16000, dtype=np.int16).tobytes()
+
+        with patch('stt_engine.transcription.whisper_client.BatchedInferencePipeline') as mock_pipeline_cls:
+            result = await engine.transcribe(audio_bytes, is_final=True)
+
+        assert result["text"] == "単独"
+        mock_pipeline_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_stops_worker_and_fails_pending_requests(self, batching_engine):
+        """WHEN the engine is closed while a request waits in the batch window
+        THEN the worker task is cancelled and awaited, and the request fails."""
+        engine = batching_engine(max_batch_size=4, batch_window_ms=10_000)
+        audio_bytes = np.random.randint(-32768, 32767, 16000, dtype=np.int16).tobytes()
+
+        pending = asyncio.create_task(engine.transcribe(audio_bytes, is_final=True))
+        while engine._batch_worker_task is None or engine._batch_queue.qsize():
+            await asyncio.sleep(0)
+        worker = engine._batch_worker_task
+
+        await engine.close()
+
+        assert worker.cancelled()
+        assert engine._batch_worker_task is None
+        result = await asyncio.wait_for(pending, timeout=1.0)
+        assert result["error"] == "WhisperSTTEngine closed"
+        engine.model.transcribe.assert_not_called()
+
+        await engine.close()  # idempotent
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])